@@ -2,28 +2,77 @@
 # Leader configuration loading
 
 PRINT_PREFIX = "LEADER CONFIG"
+_WARN = f"[WARNING] [{PRINT_PREFIX}] "
 
 # Standard library imports
 import json
 import os
+import pickle
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 
 # Third-party imports
 from discord import app_commands
+try:
+    import orjson # Optional, faster JSON parsing
+except ImportError:
+    orjson = None
 
 LEADER_CONFIG_PATH: str = os.path.join("config", "leader_config.json")
 
-with open(LEADER_CONFIG_PATH, "r") as file:
-    leader_config: dict = json.load(file)
+def _read_leader_config(path: str) -> dict:
+    """Load the leader config, using the pickle sidecar when it is newer than the JSON source."""
+    cache_path = path + ".pkl" # Parsed config sidecar, skips JSON parsing on warm starts
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            with open(cache_path, "rb") as cache_file:
+                return pickle.load(cache_file)
+    except Exception:
+        pass # Missing or corrupt cache, fall back to JSON
 
-LEADER_TIERS: list[str] = [tier.lower() for tier in leader_config.get("leader_tiers", {}).keys()]
-LEADER_TIERS_CHOICE: list[app_commands.Choice[str]] = [app_commands.Choice(name=tier, value=tier) for tier in LEADER_TIERS]
+    if orjson is not None:
+        with open(path, "rb") as file:
+            config = orjson.loads(file.read())
+    else:
+        with open(path, "r") as file:
+            config = json.load(file)
 
+    try:
+        with open(cache_path, "wb") as cache_file:
+            pickle.dump(config, cache_file, protocol=5)
+    except Exception as e:
+        print(_WARN + f"Failed to write leader config cache: {e}")
+    return config
 
-def get_leader_tier_config(tier: str) -> dict:
-    """Get the configuration for a specific leader tier.
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only MappingProxyType views and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Read-only, which keeps the memoized getters below sound
+leader_config: Mapping[str, Any] = _freeze(_read_leader_config(LEADER_CONFIG_PATH))
+
+# Precomputed lookups, leader_config is only read once at import
+_TIERS_MAP: Mapping[str, Mapping[str, Any]] = MappingProxyType({tier.lower(): tier_config for tier, tier_config in leader_config.get("leader_tiers", {}).items()})
+_ROLE_IDS: Mapping[str, int] = MappingProxyType({tier: tier_config["role_id"] for tier, tier_config in _TIERS_MAP.items() if tier_config.get("role_id") is not None})
+_EMPTY: Mapping[str, Any] = MappingProxyType({}) # Shared empty tier config for misses
+
+LEADER_TIERS: list[str] = list(_TIERS_MAP.keys())
+LEADER_TIERS_TUPLE: tuple[str, ...] = tuple(LEADER_TIERS)
+# Shared immutable choices, app_commands.choices requires a list so pass list(LEADER_TIERS_CHOICE) there
+LEADER_TIERS_CHOICE: tuple[app_commands.Choice[str], ...] = tuple(app_commands.Choice(name=tier, value=tier) for tier in LEADER_TIERS)
+
+
+@lru_cache(maxsize=None)
+def get_leader_tier_config(tier: str) -> Mapping[str, Any]:
+    """Get the read-only configuration for a specific leader tier.
     
     Returns:
-        dict: Tier configuration with structure:
+        Mapping: Tier configuration with structure:
         {
             "wins_to_reach": int | None,
             "hdt_days": int | None,
@@ -31,18 +80,27 @@ def get_leader_tier_config(tier: str) -> dict:
             "role_id": int
         }
     """
-    return leader_config.get("leader_tiers", {}).get(tier.lower(), {})
+    return _TIERS_MAP.get(tier.lower(), _EMPTY)
 
+@lru_cache(maxsize=None)
 def get_leader_role_id(tier: str) -> int | None:
     """Get the Discord role ID for a specific leader tier."""
-    tier_config = get_leader_tier_config(tier)
-    return tier_config.get("role_id", None)
+    return _ROLE_IDS.get(tier.lower(), None)
 
-def get_all_leader_role_ids() -> dict[str, int]:
-    """Get a mapping of leader tiers to their Discord role IDs.
+def get_leader_tier_config_fast(tier_lower: str) -> Mapping[str, Any]:
+    """Same as get_leader_tier_config, but expects an already lowercase tier (e.g. from LEADER_TIERS)."""
+    return _TIERS_MAP.get(tier_lower, _EMPTY)
+
+def get_leader_role_id_fast(tier_lower: str) -> int | None:
+    """Same as get_leader_role_id, but expects an already lowercase tier (e.g. from LEADER_TIERS)."""
+    return _ROLE_IDS.get(tier_lower, None)
+
+@lru_cache(maxsize=1)
+def get_all_leader_role_ids() -> Mapping[str, int]:
+    """Get a read-only mapping of leader tiers to their Discord role IDs.
     
     Returns:
-        dict[str, int]: Dictionary with structure:
+        Mapping[str, int]: Mapping with structure:
         {
             "trial": 1450547888613490885,
             "graduate": 1450547888613490886,
@@ -50,13 +108,15 @@ def get_all_leader_role_ids() -> dict[str, int]:
             ...
         }
     """
-    role_ids = {}
-    for tier in LEADER_TIERS:
-        role_id = get_leader_role_id(tier)
-        if role_id is not None:
-            role_ids[tier] = role_id
-    return role_ids
+    return _ROLE_IDS
 
+@lru_cache(maxsize=1)
 def get_general_leader_role_id() -> int | None:
     """Get the general leader role ID."""
     return leader_config.get("general_leader_role_id", None)
+
+@lru_cache(maxsize=1)
+def get_on_break_role_id() -> int | None:
+    """Get the on-break leader role ID, None if not configured."""
+    return leader_config.get("on_break_role_id", None)
+
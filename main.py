@@ -5,91 +5,114 @@
 import src.logging as logging # type: ignore
 
 PRINT_PREFIX = "MAIN"
+_INFO = f"[INFO] [{PRINT_PREFIX}] "
+_WARN = f"[WARNING] [{PRINT_PREFIX}] "
+_ERROR = f"[ERROR] [{PRINT_PREFIX}] "
 
 # Standard library imports
-import datetime
+import asyncio
 import threading
+import time
 
 # Local imports
 from config.env_vars import BOT_TOKEN, HOME_GUILD_ID, ALLOWED_GUILDS, WORKER_TOKENS
 from src.bot import bot
-from src.tasks import init_tasks
 from src.db.connections import init_databases
 from src.api.api import run_api
-from src.workers.worker import start_workers
 from src.core.fetching import get_guild_or_fetch
+from src.core.embeds import init_embed_constants
 
 # Register commands on import
 import src.commands # type: ignore
 
-print(f"[WARNING] [{PRINT_PREFIX}] Starting application. Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC")
-
-print("="*50)
-print(f"[INFO] [{PRINT_PREFIX}] Initializing databases")
+print("\n".join((
+    _WARN + f"Starting application. Time: {time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())} UTC",
+    "="*50,
+    _INFO + "Initializing databases",
+)))
 init_databases()
-print(f"[INFO] [{PRINT_PREFIX}] Databases initialized successfully")
+print(_INFO + "Databases initialized successfully")
 
 api_thread = threading.Thread(target=run_api, daemon=True)
 api_thread.start()
-print(f"[INFO] [{PRINT_PREFIX}] Local API server started in background thread")
-print("="*50)
+print(_INFO + "Local API server started in background thread\n" + "="*50)
 
 @bot.event
 async def on_ready():
-
-    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    init_embed_constants(bot)
+    now = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
 
     # Print startup information
-    print("[INFO] [MAIN] Bot is online")
-    print(f"[INFO] [MAIN] Time: {now} UTC")
-    print(f"[INFO] [MAIN] Logged in as: {bot.user} (ID: {bot.user.id})")
-    print(f"[INFO] [MAIN] Connected to {len(bot.guilds)} guild(s)")
-    print("="*50)
+    print("\n".join((
+        _INFO + "Bot is online",
+        _INFO + f"Time: {now} UTC",
+        _INFO + f"Logged in as: {bot.user} (ID: {bot.user.id})",
+        _INFO + f"Connected to {len(bot.guilds)} guild(s)",
+        "="*50,
+    )))
     
-    # Sync command tree
-    print("[INFO] [MAIN] Syncing command tree...")
-    try:
-        synced = await bot.tree.sync()
-        print(f"[INFO] [MAIN] Successfully synced {len(synced)} command(s)")
-    except Exception as e:
-        print(f"[ERROR] [MAIN] Failed to sync commands: {e}")
-        print("[WARNING] [MAIN] Bot will continue running but slash commands may not be available")
-    
-    # Sync everything to home guild
+    # Sync command tree globally and to the home guild concurrently, the two syncs are independent
+    print(_INFO + "Syncing command tree...")
     home_guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    syncs = [bot.tree.sync()]
+    if home_guild:
+        syncs.append(bot.tree.sync(guild=home_guild))
+    results = await asyncio.gather(*syncs, return_exceptions=True)
+
+    if isinstance(results[0], Exception):
+        print(_ERROR + f"Failed to sync commands: {results[0]}")
+        print(_WARN + "Bot will continue running but slash commands may not be available")
+    else:
+        print(_INFO + f"Successfully synced {len(results[0])} command(s)")
+
+    # Sync everything to home guild
     if home_guild:
-        try:
-            synced = await bot.tree.sync(guild=home_guild)
-            print(f"[INFO] [{PRINT_PREFIX}] Successfully synced {len(synced)} command(s) to home guild '{home_guild.name}' (ID: {HOME_GUILD_ID})")
-        except Exception as e:
-            print(f"[ERROR] [{PRINT_PREFIX}] Failed to sync commands to home guild: {e}")
+        if isinstance(results[1], Exception):
+            print(_ERROR + f"Failed to sync commands to home guild: {results[1]}")
+        else:
+            print(_INFO + f"Successfully synced {len(results[1])} command(s) to home guild '{home_guild.name}' (ID: {HOME_GUILD_ID})")
     else:
-        print(f"[WARNING] [{PRINT_PREFIX}] Home guild with ID {HOME_GUILD_ID} not found among connected guilds")
+        print(_WARN + f"Home guild with ID {HOME_GUILD_ID} not found among connected guilds")
     
-    # Leave guilds that are not allowed
+    # Leave guilds that are not allowed (home guild is always allowed), leaves run concurrently
+    allowed_guilds = ALLOWED_GUILDS | {HOME_GUILD_ID}
+    disallowed = []
     for guild in bot.guilds:
-        if guild.id not in ALLOWED_GUILDS:
-            print(f"[WARNING] [{PRINT_PREFIX}] Bot is in guild '{guild.name}' (ID: {guild.id}) which is not in allowed guilds.")
-            await guild.leave()
-            print(f"[INFO] [{PRINT_PREFIX}] Left guild '{guild.name}' (ID: {guild.id})")
+        if guild.id not in allowed_guilds:
+            print(_WARN + f"Bot is in guild '{guild.name}' (ID: {guild.id}) which is not in allowed guilds.")
+            disallowed.append(guild)
+        else:
+            print(_INFO + f"Bot is in allowed guild '{guild.name}' (ID: {guild.id})")
+
+    leave_results = await asyncio.gather(*(guild.leave() for guild in disallowed), return_exceptions=True)
+    for guild, result in zip(disallowed, leave_results):
+        if isinstance(result, Exception):
+            print(_ERROR + f"Failed to leave guild '{guild.name}' (ID: {guild.id}): {result}")
         else:
-            print(f"[INFO] [{PRINT_PREFIX}] Bot is in allowed guild '{guild.name}' (ID: {guild.id})")
+            print(_INFO + f"Left guild '{guild.name}' (ID: {guild.id})")
 
     # Chunk home guild members
     if home_guild:
-        print(f"[INFO] [{PRINT_PREFIX}] Chunking members of home guild '{home_guild.name}' (ID: {HOME_GUILD_ID})")
+        print(_INFO + f"Chunking members of home guild '{home_guild.name}' (ID: {HOME_GUILD_ID})")
         await home_guild.chunk()
-        print(f"[INFO] [{PRINT_PREFIX}] Finished chunking members of home guild '{home_guild.name}' (ID: {HOME_GUILD_ID})")
+        print(_INFO + f"Finished chunking members of home guild '{home_guild.name}' (ID: {HOME_GUILD_ID})")
+
+    # Deferred imports, not needed until the bot is connected
+    from src.workers.worker import start_workers
+    from src.tasks import init_tasks
 
     # Start worker threads
-    print(f"[INFO] [{PRINT_PREFIX}] Starting worker threads")
+    print(_INFO + "Starting worker threads")
     start_workers(worker_tokens=WORKER_TOKENS)
 
     # Initialize background tasks
-    print(f"[INFO] [{PRINT_PREFIX}] Initializing background tasks")
+    print(_INFO + "Initializing background tasks")
     init_tasks()
-    print(f"[INFO] [{PRINT_PREFIX}] Background tasks initialized successfully")
-    print("="*50)
-    print(f"[WARNING] [{PRINT_PREFIX}] Bot completed startup sequence at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC")
-    
+    print("\n".join((
+        _INFO + "Background tasks initialized successfully",
+        "="*50,
+        _WARN + f"Bot completed startup sequence at {time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())} UTC",
+    )))
+
+
 bot.run(BOT_TOKEN)
\ No newline at end of file
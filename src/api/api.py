@@ -2,17 +2,25 @@
 # API module for external controllers/webapps to interact with the bot.
 
 PRINT_PREFIX = "LOCAL API"
-
-# Third-party imports
-import fastapi
-import uvicorn
+_INFO = f"[INFO] [{PRINT_PREFIX}] "
 
 # Local imports
 from config.env_vars import API_HOST, API_PORT
 
-app = fastapi.FastAPI()
+# fastapi and uvicorn are imported on first use to keep them off the startup critical path
+app = None
+
+def get_app():
+    """Returns the FastAPI application, creating it on first call."""
+    global app
+    if app is None:
+        import fastapi
+        app = fastapi.FastAPI()
+    return app
 
 def run_api():
     """Function to run the FastAPI application, must be run in a separate thread."""
-    print(f"[INFO] [{PRINT_PREFIX}] Starting API server at http://{API_HOST}:{API_PORT}")
-    uvicorn.run(app, host=API_HOST, port=API_PORT)
\ No newline at end of file
+    import uvicorn
+    print(_INFO + f"Starting API server at http://{API_HOST}:{API_PORT}")
+    server = uvicorn.Server(uvicorn.Config(get_app(), host=API_HOST, port=API_PORT))
+    server.run()
\ No newline at end of file
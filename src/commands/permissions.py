@@ -1,12 +1,27 @@
 # src\commands\permissions.py
 # Helper functions for permission checks
 
+# Standard library imports
+from functools import lru_cache
+
 # Third-party imports
 import discord
 
 # Local imports
-from src.db.context_json import get_developers
+from src.db.context_json import get_developers, add_change_listener
+
+@lru_cache(maxsize=1)
+def _cached_developers_set() -> frozenset[int]:
+    """Returns the developer user IDs as a frozenset, cached until developer data changes."""
+    return frozenset(get_developers())
+
+def _on_context_change(section: str) -> None:
+    """Drop the cached developer set when developer related context data changes."""
+    if section in ("dev", "developers"):
+        _cached_developers_set.cache_clear()
+
+add_change_listener(_on_context_change)
 
 def is_developer(user_id: int) -> bool:
     """Check if the user is a developer."""
-    return user_id in get_developers()
\ No newline at end of file
+    return user_id in _cached_developers_set()
\ No newline at end of file
@@ -2,6 +2,7 @@
 # Prefixed commands to test out embeds
 
 # Standard library imports
+import asyncio
 import datetime
 
 # Third-party imports
@@ -14,6 +15,7 @@ import config.config_explorer as cfg_exp
 
 @bot.command(name="embeds_test", help="Displays every embed type for testing purposes.")
 async def embeds_test(ctx):
+    core_embeds.pin_embed_timestamp()
     # Example user and leader data
     user = ctx.author
 
@@ -28,11 +30,13 @@ async def embeds_test(ctx):
             "promoted_at": datetime.datetime.now().timestamp() - 30 * 86400,
             "on_break_since": datetime.datetime.now().timestamp() - 2 * 86400 if on_break else 0
         }
-    for tier in cfg_exp.LEADER_TIERS:
-        data = _get_bogus_leader_data(tier, on_break=(tier=="graduate"))
-        role_id = cfg_exp.get_leader_role_id(tier) if data.get("on_break_since", 0) == 0 else cfg_exp.get_on_break_role_id()
-        role = await get_role_or_fetch(ctx.guild, role_id) if role_id else None
-        embed = core_embeds.create_leader_info_embed(user, data, bogus_wins, role)
-        await ctx.send(embed=embed)
-
+    leader_data = [_get_bogus_leader_data(tier, on_break=(tier=="graduate")) for tier in cfg_exp.LEADER_TIERS]
+    role_ids = [cfg_exp.get_leader_role_id_fast(data["leader_tier"]) if data.get("on_break_since", 0) == 0 else cfg_exp.get_on_break_role_id() for data in leader_data]
 
+    # Fetch every configured role concurrently, then send the embeds in batches of 10 (Discord's per-message limit)
+    unique_ids = list({role_id for role_id in role_ids if role_id})
+    fetched = dict(zip(unique_ids, await asyncio.gather(*(get_role_or_fetch(ctx.guild, role_id) for role_id in unique_ids))))
+    roles = [fetched.get(role_id) for role_id in role_ids]
+    embeds = [core_embeds.create_leader_info_embed(user, data, len(bogus_wins), role) for data, role in zip(leader_data, roles)]
+    for i in range(0, len(embeds), 10):
+        await ctx.send(embeds=embeds[i:i + 10])
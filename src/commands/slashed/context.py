@@ -2,19 +2,28 @@
 # Slashed commands to interact with the context json of the bot.
 
 PRINT_PREFIX = "COMMANDS - SLASHED - CONTEXT"
+_INFO = f"[INFO] [{PRINT_PREFIX}] "
+_WARN = f"[WARNING] [{PRINT_PREFIX}] "
 
 # Standard library imports
-import json
+import asyncio
+import gzip
 import io
+from functools import lru_cache
 from typing import Callable
 
 # Third-party imports
 import discord
 from discord import app_commands
+try:
+    import orjson # Optional, faster JSON serialization
+except ImportError:
+    orjson = None
+    import json # Fallback serializer, only imported when orjson is unavailable
 
 # Local imports
 from src.bot import bot
-from src.core.embeds import create_success_embed, create_error_embed
+from src.core.embeds import create_success_embed, create_error_embed, embed_timestamp, pin_embed_timestamp
 from src.db.context_json import (
     add_category_entry,
     add_channel_entry,
@@ -33,24 +42,90 @@ from src.db.context_json import (
     delete_role_entry,
     delete_dev_entry
 )
-from src.db.context_json import export_context_json
+from src.db.context_json import append_to_list_entry, get_revision, last_save, serialize_context_json
 from src.commands.permissions import is_developer
 
-def _decide_entry_type(entry_type: str, caller_id: int) -> tuple[Callable, Callable, Callable]:
-    """Returns the appropriate functions for the given entry type."""
-    entry_type = entry_type.lower()
-    if entry_type == "category":
-        return get_category_entry, add_category_entry, delete_category_entry
-    elif entry_type == "channel":
-        return get_channel_entry, add_channel_entry, delete_channel_entry
-    elif entry_type == "role":
-        return get_role_entry, add_role_entry, delete_role_entry
-    elif entry_type == "dev":
-        if not is_developer(caller_id): # Prevent non-developers from accessing dev entries
-            return None, None, None
-        return get_dev_entry, add_dev_entry, delete_dev_entry
-    else:
-        return None, None, None
+_GZIP_THRESHOLD = 16 * 1024 # Exports larger than this are sent gzip-compressed, smaller ones as readable JSON
+
+_export_cache: tuple[int, bytes, str] | None = None # (context revision, export bytes, filename) of the last export
+
+def _dumps_indented(context_data: dict) -> bytes:
+    """Serializes the context data as indented JSON, keys kept in their stored order."""
+    if orjson is not None:
+        return orjson.dumps(context_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(context_data, indent=2).encode()
+
+def _build_export_bytes() -> tuple[bytes, str]:
+    """Serializes the context data for export, run in a thread to keep the event loop free.
+    The result is reused until the context revision changes.
+
+    Returns:
+        tuple[bytes, str]: The file contents and the filename to upload them as.
+    """
+    global _export_cache
+    cached = _export_cache
+    if cached is not None and cached[0] == get_revision():
+        return cached[1], cached[2]
+
+    # Serialized once under the context lock, compression works on the result outside of it
+    revision, context_bytes = serialize_context_json(_dumps_indented)
+    filename = "context.json"
+    if len(context_bytes) > _GZIP_THRESHOLD:
+        context_bytes, filename = gzip.compress(context_bytes, compresslevel=6), "context.json.gz"
+
+    _export_cache = (revision, context_bytes, filename)
+    return context_bytes, filename
+
+_DEV_FUNCS = (get_dev_entry, add_dev_entry, delete_dev_entry)
+_GET, _ADD, _DELETE = 0, 1, 2 # Indexes into the _ENTRY_DISPATCH tuples
+
+# (get, add, delete) functions for each entry type
+_ENTRY_DISPATCH: dict[str, tuple[Callable, Callable, Callable]] = {
+    "category": (get_category_entry, add_category_entry, delete_category_entry),
+    "channel": (get_channel_entry, add_channel_entry, delete_channel_entry),
+    "role": (get_role_entry, add_role_entry, delete_role_entry),
+    "dev": _DEV_FUNCS,
+}
+
+# Shared command parameter descriptions
+_ENTRY_TYPE_DESC = "Type of entry (category, channel, role, dev)"
+_ENTRY_NAME_DESC = "Name of the entry"
+
+# Valid entry types, enforced by Discord through the command choices
+_ENTRY_TYPE_CHOICES: list[app_commands.Choice[str]] = [app_commands.Choice(name=entry_type, value=entry_type) for entry_type in _ENTRY_DISPATCH]
+
+@lru_cache(maxsize=1)
+def _cached_invalid_entry_embed() -> discord.Embed:
+    """Builds the shared "Invalid Entry Type" embed once, bot.user must be available."""
+    return create_error_embed("Invalid Entry Type", "The entry type is not valid or you do not have access to it. Dev entries are restricted to developers.")
+
+def _invalid_entry_embed() -> discord.Embed:
+    """Returns a copy of the cached "Invalid Entry Type" embed with a fresh timestamp."""
+    embed = _cached_invalid_entry_embed().copy()
+    embed.timestamp = embed_timestamp()
+    return embed
+
+@lru_cache(maxsize=None)
+def _success_template(title: str) -> discord.Embed:
+    """Builds the success embed for a title once, bot.user must be available."""
+    return create_success_embed(title, "")
+
+def _success(title: str, description: str) -> discord.Embed:
+    """Returns a copy of the cached success embed for title with its description and timestamp filled in."""
+    embed = _success_template(title).copy()
+    embed.description = description
+    embed.timestamp = embed_timestamp()
+    return embed
+
+async def _resolve(interaction: discord.Interaction, entry_type: str, idx: int) -> Callable | None:
+    """Returns the _GET/_ADD/_DELETE function for the entry type (a choice value).
+    Sends the invalid entry embed and returns None if it is unknown or the caller may not access it.
+    """
+    funcs = _ENTRY_DISPATCH.get(entry_type)
+    if funcs is None or (funcs is _DEV_FUNCS and not is_developer(interaction.user.id)): # Dev entries are developer only
+        await interaction.followup.send(embed=_invalid_entry_embed())
+        return None
+    return funcs[idx]
 
 class ContextCommands(app_commands.Group):
     """Group of slashed commands to manage the bot's context JSON."""
@@ -59,176 +134,167 @@ class ContextCommands(app_commands.Group):
         super().__init__(name="context", description="Manage the bot's context JSON data. (Administrator only)")
 
     async def interaction_check(self, interaction):
-        try:
-            interaction.user.guild_permissions.administrator
+        pin_embed_timestamp() # Runs in the command's task, so every embed of this command shares the timestamp
+        perms = getattr(interaction.user, "guild_permissions", None) # Absent outside guilds
+        if perms is not None and perms.administrator:
             return True
-        except Exception:
-            await interaction.response.send_message("You do not have permission to use this command.", ephemeral=True)
-            return False
+        await interaction.response.send_message("You do not have permission to use this command.", ephemeral=True)
+        return False
     
     @app_commands.command(name="export", description="Export the entire context JSON data.")
     async def export(self, interaction: discord.Interaction):
         await interaction.response.defer()
-        print(f"[INFO] [{PRINT_PREFIX}] Exporting context.json data")
+        print(_INFO + "Exporting context.json data")
 
         try:
-            context_data = export_context_json()
-            context_json_str = json.dumps(context_data, indent=2)
-            context_file = discord.File(io.StringIO(context_json_str), filename="context.json")
+            context_bytes, filename = await asyncio.to_thread(_build_export_bytes)
+            context_file = discord.File(io.BytesIO(context_bytes), filename=filename)
 
             embed = create_success_embed("Context JSON Exported", "The context.json data has been exported successfully.")
             await interaction.followup.send(embed=embed, file=context_file)
 
         except Exception as e:
-            print(f"[WARNING] {PRINT_PREFIX} Error exporting context.json: {e}")
+            print(_WARN + f"Error exporting context.json: {e}")
             embed = create_error_embed("Error Exporting Context JSON", f"An error occurred while exporting the context.json data: {e}")
             await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="delete", description="Delete an entry from the context JSON.")
-    @app_commands.describe(entry_type="Type of entry to delete (category, channel, role, dev)", entry_name="Name of the entry")
-    async def delete(self, interaction: discord.Interaction, entry_type: str, entry_name: str):
+    @app_commands.choices(entry_type=_ENTRY_TYPE_CHOICES)
+    @app_commands.describe(entry_type=_ENTRY_TYPE_DESC, entry_name=_ENTRY_NAME_DESC)
+    async def delete(self, interaction: discord.Interaction, entry_type: app_commands.Choice[str], entry_name: str):
         await interaction.response.defer()
-        print(f"[INFO] [{PRINT_PREFIX}] Deleting {entry_type} entry '{entry_name}'")
-
-        _, _, delete_entry_func = _decide_entry_type(entry_type, interaction.user.id)
+        print(_INFO + f"Deleting {entry_type.value} entry '{entry_name}'")
 
+        delete_entry_func = await _resolve(interaction, entry_type.value, _DELETE)
         if not delete_entry_func:
-            embed = create_error_embed("Invalid Entry Type", f"The entry type '{entry_type}' is not valid. Please use 'category', 'channel', 'role', or 'dev'.")
-            await interaction.followup.send(embed=embed)
             return
         
         try:
             delete_entry_func(entry_name)
-            embed = create_success_embed("Entry Deleted", f"The {entry_type} entry '{entry_name}' has been deleted.")
+            await asyncio.wrap_future(last_save()) # Only report success once it is on disk
+            embed = _success("Entry Deleted", f"The {entry_type.value} entry '{entry_name}' has been deleted.")
             await interaction.followup.send(embed=embed)
         except Exception as e:
-            print(f"[WARNING] [{PRINT_PREFIX}] Error deleting entry: {e}")
+            print(_WARN + f"Error deleting entry: {e}")
             embed = create_error_embed("Error Deleting Entry", f"An error occurred while deleting the entry: {e}")
             await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="set_id", description="Set an entry as an integer in the context JSON.")
-    @app_commands.describe(entry_type="Type of entry to set (category, channel, role, dev)", entry_name="Name of the entry", entry_id="ID of the entry")
-    async def set_id(self, interaction: discord.Interaction, entry_type: str, entry_name: str, entry_id: str):
+    @app_commands.choices(entry_type=_ENTRY_TYPE_CHOICES)
+    @app_commands.describe(entry_type=_ENTRY_TYPE_DESC, entry_name=_ENTRY_NAME_DESC, entry_id="ID of the entry")
+    async def set_id(self, interaction: discord.Interaction, entry_type: app_commands.Choice[str], entry_name: str, entry_id: str):
         await interaction.response.defer()
-        print(f"[INFO] [{PRINT_PREFIX}] Setting {entry_type} entry '{entry_name}' with ID {entry_id}")
-
-        _, add_entry_func, _ = _decide_entry_type(entry_type, interaction.user.id)
+        print(_INFO + f"Setting {entry_type.value} entry '{entry_name}' with ID {entry_id}")
 
+        add_entry_func = await _resolve(interaction, entry_type.value, _ADD)
         if not add_entry_func:
-            embed = create_error_embed("Invalid Entry Type", f"The entry type '{entry_type}' is not valid. Please use 'category', 'channel', 'role', or 'dev'.")
-            await interaction.followup.send(embed=embed)
             return
         
         try:
             add_entry_func(entry_name, int(entry_id))
-            embed = create_success_embed("Entry Set", f"The {entry_type} entry '{entry_name}' has been set with ID {entry_id}.")
+            await asyncio.wrap_future(last_save()) # Only report success once it is on disk
+            embed = _success("Entry Set", f"The {entry_type.value} entry '{entry_name}' has been set with ID {entry_id}.")
             await interaction.followup.send(embed=embed)
         except Exception as e:
-            print(f"[WARNING] [{PRINT_PREFIX}] Error setting entry: {e}")
+            print(_WARN + f"Error setting entry: {e}")
             embed = create_error_embed("Error Setting Entry", f"An error occurred while setting the entry: {e}")
             await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="set_list", description="Set an entry as a list of in the context JSON.")
-    @app_commands.describe(entry_type="Type of entry to set (category, channel, role, dev)", entry_name="Name of the entry")
-    async def set_list(self, interaction: discord.Interaction, entry_type: str, entry_name: str):
+    @app_commands.choices(entry_type=_ENTRY_TYPE_CHOICES)
+    @app_commands.describe(entry_type=_ENTRY_TYPE_DESC, entry_name=_ENTRY_NAME_DESC)
+    async def set_list(self, interaction: discord.Interaction, entry_type: app_commands.Choice[str], entry_name: str):
         await interaction.response.defer()
-        print(f"[INFO] [{PRINT_PREFIX}] Setting {entry_type} entry '{entry_name}' as a list")
-
-        _, add_entry_func, _ = _decide_entry_type(entry_type, interaction.user.id)
+        print(_INFO + f"Setting {entry_type.value} entry '{entry_name}' as a list")
 
+        add_entry_func = await _resolve(interaction, entry_type.value, _ADD)
         if not add_entry_func:
-            embed = create_error_embed("Invalid Entry Type", f"The entry type '{entry_type}' is not valid. Please use 'category', 'channel', 'role', or 'dev'.")
-            await interaction.followup.send(embed=embed)
             return
         
         try:
             add_entry_func(entry_name, [])
-            embed = create_success_embed("Entry Set as List", f"The {entry_type} entry '{entry_name}' has been set as an empty list.")
+            await asyncio.wrap_future(last_save()) # Only report success once it is on disk
+            embed = _success("Entry Set as List", f"The {entry_type.value} entry '{entry_name}' has been set as an empty list.")
             await interaction.followup.send(embed=embed)
         except Exception as e:
-            print(f"[WARNING] [{PRINT_PREFIX}] Error setting entry as list: {e}")
+            print(_WARN + f"Error setting entry as list: {e}")
             embed = create_error_embed("Error Setting Entry as List", f"An error occurred while setting the entry as a list: {e}")
             await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="set_bool", description="Set an entry as a boolean in the context JSON.")
-    @app_commands.describe(entry_type="Type of entry to set (category, channel, role, dev)", entry_name="Name of the entry", entry_value="Boolean value to set (true/false)")
-    async def set_bool(self, interaction: discord.Interaction, entry_type: str, entry_name: str, entry_value: bool):
+    @app_commands.choices(entry_type=_ENTRY_TYPE_CHOICES)
+    @app_commands.describe(entry_type=_ENTRY_TYPE_DESC, entry_name=_ENTRY_NAME_DESC, entry_value="Boolean value to set (true/false)")
+    async def set_bool(self, interaction: discord.Interaction, entry_type: app_commands.Choice[str], entry_name: str, entry_value: bool):
         await interaction.response.defer()
-        print(f"[INFO] [{PRINT_PREFIX}] Setting {entry_type} entry '{entry_name}' with boolean value {entry_value}")
-
-        _, add_entry_func, _ = _decide_entry_type(entry_type, interaction.user.id)
+        print(_INFO + f"Setting {entry_type.value} entry '{entry_name}' with boolean value {entry_value}")
 
+        add_entry_func = await _resolve(interaction, entry_type.value, _ADD)
         if not add_entry_func:
-            embed = create_error_embed("Invalid Entry Type", f"The entry type '{entry_type}' is not valid. Please use 'category', 'channel', 'role', or 'dev'.")
-            await interaction.followup.send(embed=embed)
             return
         
         try:
             add_entry_func(entry_name, bool(entry_value))
-            embed = create_success_embed("Entry Set", f"The {entry_type} entry '{entry_name}' has been set with boolean value {entry_value}.")
+            await asyncio.wrap_future(last_save()) # Only report success once it is on disk
+            embed = _success("Entry Set", f"The {entry_type.value} entry '{entry_name}' has been set with boolean value {entry_value}.")
             await interaction.followup.send(embed=embed)
         except Exception as e:
-            print(f"[WARNING] {PRINT_PREFIX} Error setting entry: {e}")
+            print(_WARN + f"Error setting entry: {e}")
             embed = create_error_embed("Error Setting Entry", f"An error occurred while setting the entry: {e}")
             await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="set_str", description="Set an entry as a string in the context JSON.")
-    @app_commands.describe(entry_type="Type of entry to set (category, channel, role, dev)", entry_name="Name of the entry", entry_value="String value to set")
-    async def set_str(self, interaction: discord.Interaction, entry_type: str, entry_name: str, entry_value: str):
+    @app_commands.choices(entry_type=_ENTRY_TYPE_CHOICES)
+    @app_commands.describe(entry_type=_ENTRY_TYPE_DESC, entry_name=_ENTRY_NAME_DESC, entry_value="String value to set")
+    async def set_str(self, interaction: discord.Interaction, entry_type: app_commands.Choice[str], entry_name: str, entry_value: str):
         await interaction.response.defer()
-        print(f"[INFO] [{PRINT_PREFIX}] Setting {entry_type} entry '{entry_name}' with string value '{entry_value}'")
-
-        _, add_entry_func, _ = _decide_entry_type(entry_type, interaction.user.id)
+        print(_INFO + f"Setting {entry_type.value} entry '{entry_name}' with string value '{entry_value}'")
 
+        add_entry_func = await _resolve(interaction, entry_type.value, _ADD)
         if not add_entry_func:
-            embed = create_error_embed("Invalid Entry Type", f"The entry type '{entry_type}' is not valid. Please use 'category', 'channel', 'role', or 'dev'.")
-            await interaction.followup.send(embed=embed)
             return
         
         try:
             add_entry_func(entry_name, str(entry_value))
-            embed = create_success_embed("Entry Set", f"The {entry_type} entry '{entry_name}' has been set with string value '{entry_value}'.")
+            await asyncio.wrap_future(last_save()) # Only report success once it is on disk
+            embed = _success("Entry Set", f"The {entry_type.value} entry '{entry_name}' has been set with string value '{entry_value}'.")
             await interaction.followup.send(embed=embed)
         except Exception as e:
-            print(f"[WARNING] [{PRINT_PREFIX}] Error setting entry: {e}")
+            print(_WARN + f"Error setting entry: {e}")
             embed = create_error_embed("Error Setting Entry", f"An error occurred while setting the entry: {e}")
             await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="append_id", description="Append an ID to a list entry in the context JSON.")
-    @app_commands.describe(entry_type="Type of entry to append to (category, channel, role, dev)", entry_name="Name of the entry", entry_id="ID to append")
-    async def append_id(self, interaction: discord.Interaction, entry_type: str, entry_name: str, entry_id: str):
+    @app_commands.choices(entry_type=_ENTRY_TYPE_CHOICES)
+    @app_commands.describe(entry_type=_ENTRY_TYPE_DESC, entry_name=_ENTRY_NAME_DESC, entry_id="ID to append")
+    async def append_id(self, interaction: discord.Interaction, entry_type: app_commands.Choice[str], entry_name: str, entry_id: str):
         await interaction.response.defer()
-        print(f"[INFO] [{PRINT_PREFIX}] Appending ID {entry_id} to {entry_type} entry '{entry_name}'")
-        get_entry_func, add_entry_func, _ = _decide_entry_type(entry_type, interaction.user.id)
-
-        if not get_entry_func or not add_entry_func:
-            embed = create_error_embed("Invalid Entry Type", f"The entry type '{entry_type}' is not valid. Please use 'category', 'channel', 'role', or 'dev'.")
-            await interaction.followup.send(embed=embed)
-            return  
+        print(_INFO + f"Appending ID {entry_id} to {entry_type.value} entry '{entry_name}'")
+        add_entry_func = await _resolve(interaction, entry_type.value, _ADD)
+        if not add_entry_func:
+            return
         
         try:
-            current_entry = get_entry_func(entry_name)
-            if current_entry is None:
-                embed = create_error_embed("Entry Not Found", f"The {entry_type} entry '{entry_name}' does not exist.")
+            status = append_to_list_entry(entry_type.value, entry_name, int(entry_id)) # Single read-modify-write
+            if status == "not_found":
+                embed = create_error_embed("Entry Not Found", f"The {entry_type.value} entry '{entry_name}' does not exist.")
                 await interaction.followup.send(embed=embed)
                 return
             
-            if not isinstance(current_entry, list):
-                embed = create_error_embed("Invalid Entry Format", f"The {entry_type} entry '{entry_name}' is not a list and cannot have IDs appended.")
+            if status == "not_list":
+                embed = create_error_embed("Invalid Entry Format", f"The {entry_type.value} entry '{entry_name}' is not a list and cannot have IDs appended.")
                 await interaction.followup.send(embed=embed)
                 return
             
-            if int(entry_id) in current_entry:
-                embed = create_error_embed("ID Already Exists", f"The ID {entry_id} already exists in the {entry_type} entry '{entry_name}'.")
+            if status == "dup":
+                embed = create_error_embed("ID Already Exists", f"The ID {entry_id} already exists in the {entry_type.value} entry '{entry_name}'.")
                 await interaction.followup.send(embed=embed)
                 return
             
-            current_entry.append(int(entry_id))
-            add_entry_func(entry_name, current_entry)
-            embed = create_success_embed("ID Appended", f"The ID {entry_id} has been appended to the {entry_type} entry '{entry_name}'.")
+            await asyncio.wrap_future(last_save()) # Only report success once it is on disk
+            embed = _success("ID Appended", f"The ID {entry_id} has been appended to the {entry_type.value} entry '{entry_name}'.")
             await interaction.followup.send(embed=embed)
         except Exception as e:
-            print(f"[WARNING] [{PRINT_PREFIX}] Error appending ID: {e}")
+            print(_WARN + f"Error appending ID: {e}")
             embed = create_error_embed("Error Appending ID", f"An error occurred while appending the ID: {e}")
             await interaction.followup.send(embed=embed)
 
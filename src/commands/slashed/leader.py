@@ -2,12 +2,21 @@
 # Slash commands for managing leaders
 
 PRINT_PREFIX = "COMMANDS - SLASHED - LEADER"
+_INFO = f"[INFO] [{PRINT_PREFIX}] "
+_WARN = f"[WARNING] [{PRINT_PREFIX}] "
+_ERROR = f"[ERROR] [{PRINT_PREFIX}] "
+
+# Standard library imports
+import asyncio
+import time
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
 
 # Third-party imports
 import re
 import discord
 from discord import app_commands
-from typing import Optional
 
 # Local imports
 from src.bot import bot
@@ -17,12 +26,47 @@ from config.config_explorer import (
     LEADER_TIERS_CHOICE,
     get_all_leader_role_ids,
     get_general_leader_role_id,
+    get_on_break_role_id,
 )
-from src.core.users.roles import edit_user_roles, add_role_to_user
+from src.core.users.roles import add_role_to_user, edit_user_roles
 from src.core.fetching import get_role_or_fetch
-from src.core.embeds import create_error_embed, create_success_embed
+from src.core.embeds import create_error_embed, create_success_embed, pin_embed_timestamp
 from src.core.helpers import log_to_leader_logs
 
+class _LeaderRoleConfig(NamedTuple):
+    """Snapshot of the leader role configuration."""
+    tier_map: Mapping[str, int] # Tier -> role ID
+    general_id: int | None
+    on_break_id: int | None
+    remove_set_by_tier: Mapping[str, frozenset[int]] # Tier -> role IDs to strip when assigning that tier
+
+@lru_cache(maxsize=1)
+def _leader_role_config_snapshot() -> _LeaderRoleConfig:
+    """Build the leader role configuration once, the config is only loaded at import."""
+    tier_map = get_all_leader_role_ids()
+    on_break_id = get_on_break_role_id()
+    extra = frozenset() if on_break_id is None else frozenset((on_break_id,))
+    # Small static table (one entry per tier), read-only so the shared snapshot cannot be mutated
+    remove_set_by_tier = MappingProxyType({
+        tier: frozenset(rid for t, rid in tier_map.items() if t != tier) | extra
+        for tier in tier_map
+    })
+    return _LeaderRoleConfig(tier_map, get_general_leader_role_id(), on_break_id, remove_set_by_tier)
+
+# Precomputed at import, the leader config does not change at runtime
+_ROLES_TO_REMOVE_BY_TIER: Mapping[str, frozenset[int]] = _leader_role_config_snapshot().remove_set_by_tier
+_EMPTY_FROZENSET: frozenset[int] = frozenset()
+
+_ROLE_CACHE_TTL = 30.0 # Seconds a resolved (tier role, general role) pair is reused
+_role_cache: dict[tuple[int, int], tuple[float, discord.Role, discord.Role]] = {} # (guild ID, tier role ID) -> (stored at, tier role, general role)
+
+async def _invalidate_role_cache(*_) -> None:
+    """Drop cached leader roles whenever a guild role changes or is deleted."""
+    _role_cache.clear()
+
+bot.add_listener(_invalidate_role_cache, "on_guild_role_update")
+bot.add_listener(_invalidate_role_cache, "on_guild_role_delete")
+
 async def _get_leader_roles(
     guild: discord.Guild, tier_role_id: int
 ) -> tuple[Optional[discord.Role], Optional[discord.Role]]:
@@ -35,40 +79,51 @@ async def _get_leader_roles(
     Returns:
         Tuple of (tier_role, general_leader_role), either can be None if not found
     """
-    tier_role = await get_role_or_fetch(guild, tier_role_id)
-    general_role = await get_role_or_fetch(guild, get_general_leader_role_id())
+    key = (guild.id, tier_role_id)
+    cached = _role_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _ROLE_CACHE_TTL:
+        return cached[1], cached[2]
+    
+    general_role_id = _leader_role_config_snapshot().general_id
+    # Role cache first, only fall back to fetching (concurrently) on a miss
+    tier_role, general_role = guild.get_role(tier_role_id), guild.get_role(general_role_id)
+    if tier_role is None or general_role is None:
+        tier_role, general_role = await asyncio.gather(
+            get_role_or_fetch(guild, tier_role_id),
+            get_role_or_fetch(guild, general_role_id),
+        )
     
     if tier_role is None:
-        print(f"[ERROR] [{PRINT_PREFIX}] Could not find role with ID {tier_role_id} in guild.")
+        print(_ERROR + f"Could not find role with ID {tier_role_id} in guild.")
     
     if general_role is None:
-        general_role_id = get_general_leader_role_id()
-        print(f"[ERROR] [{PRINT_PREFIX}] Could not find general leader role with ID {general_role_id} in guild.")
+        print(_ERROR + f"Could not find general leader role with ID {general_role_id} in guild.")
     
+    if tier_role is not None and general_role is not None:
+        _role_cache[key] = (now, tier_role, general_role)
     return tier_role, general_role
 
 
-def _calculate_roles_to_remove(tier: str) -> list[int]:
+def _calculate_roles_to_remove(tier: str) -> frozenset[int]:
     """Calculate which leader roles should be removed when assigning a new tier.
     
     Args:
         tier: The tier being assigned
         
     Returns:
-        List of role IDs to remove
+        Role IDs to remove (other tier roles and the on-break role)
     """
-    all_tier_roles = get_all_leader_role_ids()
-    roles_to_remove = [rid for t, rid in all_tier_roles.items() if t != tier]
-    return roles_to_remove
+    return _ROLES_TO_REMOVE_BY_TIER.get(tier, _EMPTY_FROZENSET)
 
 
-def _build_new_role_list(
+def _build_new_role_ids(
     current_roles: list[discord.Role],
     tier_role: discord.Role,
     general_role: discord.Role,
-    roles_to_remove: list[int],
-) -> list[discord.Role]:
-    """Build the new role list for a leader.
+    roles_to_remove: frozenset[int],
+) -> set[int]:
+    """Build the new role ID set for a leader.
     
     Args:
         current_roles: Member's current roles
@@ -77,18 +132,10 @@ def _build_new_role_list(
         roles_to_remove: Role IDs that should be removed
         
     Returns:
-        New list of roles for the member
+        Role IDs the member should end up with
     """
-    # Filter out old leader roles
-    new_roles = [
-        role for role in current_roles
-        if role.id not in roles_to_remove
-        and role.id != tier_role.id
-        and role.id != general_role.id
-    ]
-    # Add the new leader roles
-    new_roles.extend([tier_role, general_role])
-    return new_roles
+    # Drop old leader roles and add the new ones
+    return ({role.id for role in current_roles} - roles_to_remove) | {tier_role.id, general_role.id}
 
 
 async def _assign_proper_leader_role(member: discord.Member, tier: str) -> bool:
@@ -102,11 +149,10 @@ async def _assign_proper_leader_role(member: discord.Member, tier: str) -> bool:
         True if successful, False otherwise
     """
     # Validate tier and get role ID
-    role_ids = get_all_leader_role_ids()
-    tier_role_id = role_ids.get(tier)
+    tier_role_id = _leader_role_config_snapshot().tier_map.get(tier)
     
     if tier_role_id is None:
-        print(f"[WARN] [{PRINT_PREFIX}] No role ID found for tier '{tier}'. Cannot assign role.")
+        print(_WARN + f"No role ID found for tier '{tier}'. Cannot assign role.")
         return False
     
     # Fetch required roles
@@ -114,32 +160,50 @@ async def _assign_proper_leader_role(member: discord.Member, tier: str) -> bool:
     if tier_role is None or general_role is None:
         return False
     
+    # Latest cached state, the interaction payload's member can be stale under concurrent edits
+    fresh = member.guild.get_member(member.id) or member
+    
     # Calculate which roles to remove and build new role list
     roles_to_remove = _calculate_roles_to_remove(tier)
-    new_roles = _build_new_role_list(
-        member.roles, tier_role, general_role, roles_to_remove
+    new_role_ids = _build_new_role_ids(
+        fresh.roles, tier_role, general_role, roles_to_remove
     )
+    current_ids = {role.id for role in fresh.roles}
+    if new_role_ids == current_ids:
+        print(_INFO + f"User {member.id} already has the correct roles for tier '{tier}', skipping role edit.")
+        return True
+    added_ids = new_role_ids - current_ids
     
     # Apply the role changes
     try:
-        success = await edit_user_roles(
-            user_id=member.id, new_roles=new_roles, reason="Promoted to leader"
-        )
+        if len(added_ids) == 1 and current_ids <= new_role_ids:
+            # Single role to add and nothing to remove, use the atomic per-role endpoint
+            success = await add_role_to_user(
+                user_id=member.id, role_id=next(iter(added_ids)), reason="Promoted to leader"
+            )
+        else:
+            success = await edit_user_roles(
+                user_id=member.id, new_roles=[discord.Object(id=role_id) for role_id in new_role_ids], reason="Promoted to leader"
+            )
         
         if success:
-            print(f"[INFO] [{PRINT_PREFIX}] Assigned leader role '{tier}' to user {member.id}.")
+            print(_INFO + f"Assigned leader role '{tier}' to user {member.id}.")
         else:
-            print(f"[ERROR] [{PRINT_PREFIX}] Failed to assign leader role '{tier}' to user {member.id}.")
+            print(_ERROR + f"Failed to assign leader role '{tier}' to user {member.id}.")
         
         return success
         
     except Exception as e:
-        print(f"[ERROR] [{PRINT_PREFIX}] Exception while assigning leader role '{tier}' to user {member.id}: {e}")
+        print(_ERROR + f"Exception while assigning leader role '{tier}' to user {member.id}: {e}")
         return False
     
 async def _remove_leader_roles(member: discord.Member) -> bool:
     """Remove all leader roles from the member.
     
+    Uses a single bulk role edit rather than one atomic removal per role. Several roles usually go at
+    once, so one request beats several, at the cost of overwriting role changes made between
+    reading the member and the edit landing.
+    
     Args:
         member: The Discord member to demote
         
@@ -147,14 +211,15 @@ async def _remove_leader_roles(member: discord.Member) -> bool:
         True if successful, False otherwise
     """
     # Gather all leader-related role IDs
-    all_tier_roles = get_all_leader_role_ids()
-    roles_to_remove = [
-        *all_tier_roles.values(),
-        get_general_leader_role_id(),
-    ]
+    cfg = _leader_role_config_snapshot()
+    roles_to_remove = {*cfg.tier_map.values(), cfg.general_id, cfg.on_break_id}
     
-    # Filter out all leader roles
-    new_roles = [role for role in member.roles if role.id not in roles_to_remove]
+    # Filter out all leader roles, using the latest cached state rather than the possibly stale payload
+    current_roles = (member.guild.get_member(member.id) or member).roles
+    new_roles = [discord.Object(id=role.id) for role in current_roles if role.id not in roles_to_remove]
+    if len(new_roles) == len(current_roles):
+        print(_INFO + f"User {member.id} has no leader roles, skipping role edit.")
+        return True
     
     try:
         success = await edit_user_roles(
@@ -162,17 +227,70 @@ async def _remove_leader_roles(member: discord.Member) -> bool:
         )
         
         if success:
-            print(f"[INFO] [{PRINT_PREFIX}] Removed leader roles from user {member.id}.")
+            print(_INFO + f"Removed leader roles from user {member.id}.")
         else:
-            print(f"[ERROR] [{PRINT_PREFIX}] Failed to remove leader roles from user {member.id}.")
+            print(_ERROR + f"Failed to remove leader roles from user {member.id}.")
         
         return success
         
     except Exception as e:
-        print(f"[ERROR] [{PRINT_PREFIX}] Exception while removing leader roles from user {member.id}: {e}")
+        print(_ERROR + f"Exception while removing leader roles from user {member.id}: {e}")
         return False
 
 
+async def _undo_partial_promotion(member: discord.Member, previous: dict | None, roles_applied: bool) -> None:
+    """Compensate a promotion where only one of the role edit and the database write succeeded.
+    
+    Args:
+        member: The member being promoted
+        previous: The member's leader entry before the promotion, None if they were not a leader
+        roles_applied: True if the role edit succeeded (database write failed), False for the opposite
+    """
+    previous_tier = previous["leader_tier"] if previous else None
+    if roles_applied:
+        # Database write failed, put the roles back
+        if previous_tier:
+            undone = await _assign_proper_leader_role(member, previous_tier)
+        else:
+            undone = await _remove_leader_roles(member)
+    else:
+        # Role edit failed, put the database entry back
+        if previous_tier:
+            undone = await asyncio.to_thread(leaders.add_leader, member.id, previous_tier)
+        else:
+            undone = await asyncio.to_thread(leaders.remove_leader, member.id)
+
+    if undone:
+        print(_WARN + f"Reverted partial promotion of user {member.id}.")
+    else:
+        print(_ERROR + f"Failed to revert partial promotion of user {member.id}, manual repair needed.")
+
+
+def _handle_errors(domain: str, action: str):
+    """Decorator for leader commands, sends a single error embed if the command raises.
+    
+    Args:
+        domain: Embed title prefix, e.g. "Promotion" gives "Promotion Error"
+        action: What the command was doing, e.g. "promoting the user"
+    """
+    title = f"{domain} Error"
+    def decorator(func: callable):
+        @wraps(func)
+        async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+            try:
+                return await func(self, interaction, *args, **kwargs)
+            except Exception as e:
+                user = kwargs.get("user")
+                print(_ERROR + f"Error {action} {user.id if user else 'unknown'}: {e}")
+                embed = create_error_embed(
+                    title=title,
+                    description=f"An unexpected error occurred while {action}: {e}",
+                )
+                await interaction.followup.send(embed=embed)
+        return wrapper
+    return decorator
+
+
 class LeaderCommands(app_commands.Group):
 
     def __init__(self):
@@ -190,9 +308,12 @@ class LeaderCommands(app_commands.Group):
         Returns:
             True if user has permission, False otherwise
         """
+        pin_embed_timestamp() # Runs in the command's task, so every embed of this command shares the timestamp
+        
+        # Cheap permission attribute first, is_developer is a cached set lookup
         has_permission = (
             interaction.user.guild_permissions.manage_roles
-            or is_developer(interaction.user)
+            or is_developer(interaction.user.id)
         )
         
         if not has_permission:
@@ -208,240 +329,224 @@ class LeaderCommands(app_commands.Group):
         user="The user to promote to leader",
         tier="The leader tier to assign to the user.",
     )
-    @app_commands.choices(tier=LEADER_TIERS_CHOICE)
+    @app_commands.choices(tier=list(LEADER_TIERS_CHOICE))
+    @_handle_errors("Promotion", "promoting the user")
     async def promote(self, interaction: discord.Interaction, user: discord.Member, tier: str):
         """Promote a user to a specified leader tier."""
         await interaction.response.defer()
         
-        # Check blacklist status
-        try:
-            if users.is_leader_blacklisted(user.id):
-                embed = create_error_embed(
-                    title="Promotion Failed",
-                    description=f"{user.mention} is blacklisted from being promoted to leader.",
-                )
-                await interaction.followup.send(embed=embed)
-                return
-        except Exception as e:
-            print(f"[ERROR] [{PRINT_PREFIX}] Error checking blacklist status for user {user.id}: {e}")
+        # Blacklist status and current leader entry in one lookup
+        user_data = await asyncio.to_thread(users.get_user_with_leader, user.id)
+        if user_data is not None and user_data["is_leader_blacklisted"]:
             embed = create_error_embed(
-                title="Promotion Error",
-                description=f"An unexpected error occurred while checking blacklist status: {e}",
+                title="Promotion Failed",
+                description=f"{user.mention} is blacklisted from being promoted to leader.",
             )
             await interaction.followup.send(embed=embed)
             return
         
-        # Assign role
-        try:
-            role_assigned = await _assign_proper_leader_role(user, tier)
-            if not role_assigned:
-                embed = create_error_embed(
-                    title="Promotion Error",
-                    description=f"Could not assign the leader role for tier '{tier}'. Please check the configuration.",
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
-            # Update database
-            success = leaders.add_leader(user.id, tier)
-            if not success:
-                embed = create_error_embed(
-                    title="Promotion Error",
-                    description=(
-                        f"Failed to add {user.mention} to the leaders database. "
-                        "The role was assigned but database update failed."
-                    ),
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
-            # Success
-            embed = create_success_embed(
-                title="User Promoted",
-                description=f"Successfully promoted {user.mention} to leader tier '{tier}'.",
-            )
-            print(f"[INFO] [{PRINT_PREFIX}] Promoted user {user.id} to tier '{tier}' by {interaction.user.id}.")
-            
-            # Log to leader logs
-            await log_to_leader_logs(
-                title="Promotion",
-                description=f"{user.mention} was promoted to **{tier}**.",
-                enforcer=interaction.user
+        # Assign role and update database concurrently, undoing whichever side succeeded if the other failed
+        # State to restore on a partial failure, the join starts from users so a leader row without one needs its own lookup
+        if user_data is not None:
+            previous = user_data["leader"]
+        else:
+            previous = await asyncio.to_thread(leaders.get_leader, user.id)
+        role_assigned, success = await asyncio.gather(
+            _assign_proper_leader_role(user, tier),
+            asyncio.to_thread(leaders.add_leader, user.id, tier),
+            return_exceptions=True,
+        )
+        role_assigned, success = role_assigned is True, success is True
+        if role_assigned != success:
+            await _undo_partial_promotion(user, previous, roles_applied=role_assigned)
+
+        if not role_assigned:
+            embed = create_error_embed(
+                title="Promotion Error",
+                description=f"Could not assign the leader role for tier '{tier}'. Please check the configuration.",
             )
-            
-        except Exception as e:
-            print(f"[ERROR] [{PRINT_PREFIX}] Error promoting user {user.id} to tier '{tier}': {e}")
+            await interaction.followup.send(embed=embed)
+            return
+        
+        if not success:
             embed = create_error_embed(
                 title="Promotion Error",
-                description=f"An unexpected error occurred while promoting the user: {e}",
+                description=(
+                    f"Failed to add {user.mention} to the leaders database. "
+                    "The role change was reverted."
+                ),
             )
+            await interaction.followup.send(embed=embed)
+            return
+        
+        # Success
+        embed = create_success_embed(
+            title="User Promoted",
+            description=f"Successfully promoted {user.mention} to leader tier '{tier}'.",
+        )
+        print(_INFO + f"Promoted user {user.id} to tier '{tier}' by {interaction.user.id}.")
+        
+        # Log to leader logs
+        await log_to_leader_logs(
+            title="Promotion",
+            description=f"{user.mention} was promoted to **{tier}**.",
+            enforcer=interaction.user
+        )
         
         await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="demote", description="Demote a leader.")
     @app_commands.describe(user="The leader to demote.")
+    @_handle_errors("Demotion", "demoting the user")
     async def demote(self, interaction: discord.Interaction, user: discord.Member):
         """Remove leader roles from a user and update the database."""
         await interaction.response.defer()
         
-        try:
-            # Verify user is a leader
-            leader_data = leaders.get_leader(user.id)
-            if leader_data is None:
-                embed = create_error_embed(
-                    title="Demotion Failed",
-                    description=f"{user.mention} is not a leader or does not exist in the database.",
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
-            # Remove roles
-            roles_removed = await _remove_leader_roles(user)
-            if not roles_removed:
-                embed = create_error_embed(
-                    title="Demotion Error",
-                    description=f"Failed to remove leader roles from {user.mention}.",
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
-            # Update database
-            success = leaders.remove_leader(user.id)
-            if not success:
-                embed = create_error_embed(
-                    title="Demotion Error",
-                    description=(
-                        f"Failed to update {user.mention} in the leaders database. "
-                        "The roles were removed but database update failed, please try again."
-                    ),
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
-            # Success
-            embed = create_success_embed(
-                title="User Demoted",
-                description=f"Successfully demoted {user.mention} from leader.",
+        # Verify user is a leader
+        leader_data = await asyncio.to_thread(leaders.get_leader, user.id)
+        if leader_data is None:
+            embed = create_error_embed(
+                title="Demotion Failed",
+                description=f"{user.mention} is not a leader or does not exist in the database.",
             )
-            print(f"[INFO] [{PRINT_PREFIX}] Demoted user {user.id} from leader by {interaction.user.id}.")
-            
-            # Log to leader logs
-            await log_to_leader_logs(
-                title="Demotion",
-                description=f"{user.mention} was demoted from **{leader_data['leader_tier']}**.",
-                enforcer=interaction.user
+            await interaction.followup.send(embed=embed)
+            return
+        
+        # Remove roles and update database concurrently, they are independent
+        roles_removed, success = await asyncio.gather(
+            _remove_leader_roles(user),
+            asyncio.to_thread(leaders.remove_leader, user.id),
+        )
+        if not roles_removed:
+            embed = create_error_embed(
+                title="Demotion Error",
+                description=f"Failed to remove leader roles from {user.mention}."
+                + (" They were removed from the leaders database, please remove the roles manually." if success else ""),
             )
-            
-        except Exception as e:
-            print(f"[ERROR] [{PRINT_PREFIX}] Error demoting user {user.id}: {e}")
+            await interaction.followup.send(embed=embed)
+            return
+        
+        if not success:
             embed = create_error_embed(
                 title="Demotion Error",
-                description=f"An unexpected error occurred while demoting the user: {e}",
+                description=(
+                    f"Failed to update {user.mention} in the leaders database. "
+                    "The roles were removed but database update failed, please try again."
+                ),
             )
+            await interaction.followup.send(embed=embed)
+            return
+        
+        # Success
+        embed = create_success_embed(
+            title="User Demoted",
+            description=f"Successfully demoted {user.mention} from leader.",
+        )
+        print(_INFO + f"Demoted user {user.id} from leader by {interaction.user.id}.")
+        
+        # Log to leader logs
+        await log_to_leader_logs(
+            title="Demotion",
+            description=f"{user.mention} was demoted from **{leader_data['leader_tier']}**.",
+            enforcer=interaction.user
+        )
         
         await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="blacklist", description="Blacklist a user from being promoted to leader.")
     @app_commands.describe(user="The user to blacklist from being promoted to leader.")
+    @_handle_errors("Leader Blacklist", "blacklisting the user")
     async def blacklist(self, interaction: discord.Interaction, user: discord.User):
         """Blacklist a user from being promoted to leader."""
         await interaction.response.defer()
         
-        try:
-            # Check if user is currently a leader and remove roles if necessary
-            leader_data = leaders.get_leader(user.id)
-            if leader_data is not None:
-                roles_removed = await _remove_leader_roles(user)
-                if not roles_removed:
-                    print(f"[WARN] [{PRINT_PREFIX}] Could not remove leader roles from user {user.id} during blacklist.")
-                    embed = create_error_embed(
-                        title="Blacklist Error",
-                        description=f"Failed to remove leader roles from {user.mention} during blacklist.",
-                    )
-                    await interaction.followup.send(embed=embed)
-                    return
-                
-            # Remove from leaders database if present
-            if leader_data is not None:
-                db_removed = leaders.remove_leader(user.id)
-                if not db_removed:
-                    print(f"[WARN] [{PRINT_PREFIX}] Could not remove user {user.id} from leaders database during blacklist.")
-                    embed = create_error_embed(
-                        title="Blacklist Error",
-                        description=f"Failed to remove {user.mention} from the leaders database during blacklist.",
-                    )
-                    await interaction.followup.send(embed=embed)
-                    return
-            
-            # Add to blacklist
-            success = users.add_leader_blacklist(user.id)
-            if not success:
+        # Check if user is currently a leader
+        leader_data = await asyncio.to_thread(leaders.get_leader, user.id)
+        if leader_data is not None:
+            # Users that left the guild have no roles to strip, only the database row goes
+            member = interaction.guild.get_member(user.id)
+            if member is None:
+                roles_removed, db_removed = True, await asyncio.to_thread(leaders.remove_leader, user.id)
+            else:
+                # Role removal and the leaders database removal are independent, run them concurrently
+                roles_removed, db_removed = await asyncio.gather(
+                    _remove_leader_roles(member),
+                    asyncio.to_thread(leaders.remove_leader, user.id),
+                )
+            if not roles_removed:
+                print(_WARN + f"Could not remove leader roles from user {user.id} during blacklist.")
                 embed = create_error_embed(
                     title="Blacklist Error",
-                    description=f"Failed to add {user.mention} to the blacklist database.",
+                    description=f"Failed to remove leader roles from {user.mention} during blacklist."
+                    + (" They were removed from the leaders database, please remove the roles manually." if db_removed else ""),
                 )
                 await interaction.followup.send(embed=embed)
                 return
             
-            # Success
-            embed = create_success_embed(
-                title="Leader Blacklisted",
-                description=f"Successfully blacklisted {user.mention} from being promoted to leader.",
-            )
-            print(f"[INFO] [{PRINT_PREFIX}] Blacklisted user {user.id} from leader promotions by {interaction.user.id}.")
-            
-            # Log to leader logs
-            await log_to_leader_logs(
-                title="Blacklist",
-                description=f"{user.mention} was blacklisted from being promoted to leader.",
-                enforcer=interaction.user
-            )
-            
-        except Exception as e:
-            print(f"[ERROR] [{PRINT_PREFIX}] Error blacklisting user {user.id}: {e}")
+            if not db_removed:
+                print(_WARN + f"Could not remove user {user.id} from leaders database during blacklist.")
+                embed = create_error_embed(
+                    title="Blacklist Error",
+                    description=f"Failed to remove {user.mention} from the leaders database during blacklist.",
+                )
+                await interaction.followup.send(embed=embed)
+                return
+        
+        # Add to blacklist
+        success = await asyncio.to_thread(users.add_leader_blacklist, user.id)
+        if not success:
             embed = create_error_embed(
-                title="Leader Blacklist Error",
-                description=f"An unexpected error occurred while blacklisting the user: {e}",
+                title="Blacklist Error",
+                description=f"Failed to add {user.mention} to the blacklist database.",
             )
+            await interaction.followup.send(embed=embed)
+            return
+        
+        # Success
+        embed = create_success_embed(
+            title="Leader Blacklisted",
+            description=f"Successfully blacklisted {user.mention} from being promoted to leader.",
+        )
+        print(_INFO + f"Blacklisted user {user.id} from leader promotions by {interaction.user.id}.")
+        
+        # Log to leader logs
+        await log_to_leader_logs(
+            title="Blacklist",
+            description=f"{user.mention} was blacklisted from being promoted to leader.",
+            enforcer=interaction.user
+        )
         
         await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="unblacklist",description="Remove a user from the leader promotion blacklist.",)
     @app_commands.describe(user="The user to remove from the leader promotion blacklist.")
+    @_handle_errors("Unblacklist", "unblacklisting the user")
     async def unblacklist(self, interaction: discord.Interaction, user: discord.User):
         """Remove a user from the leader promotion blacklist."""
         await interaction.response.defer()
         
-        try:
-            success = users.remove_leader_blacklist(user.id)
-            if not success:
-                embed = create_error_embed(
-                    title="Unblacklist Error",
-                    description=f"Failed to remove {user.mention} from the blacklist database.",
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
-            # Success
-            embed = create_success_embed(
-                title="User Unblacklisted",
-                description=f"Successfully removed {user.mention} from the leader promotion blacklist.",
-            )
-            print(f"[INFO] [{PRINT_PREFIX}] Unblacklisted user {user.id} from leader promotions by {interaction.user.id}.")
-            
-            # Log to leader logs
-            await log_to_leader_logs(
-                title="Blacklist",
-                description=f"{user.mention} was removed from the leader promotion blacklist.",
-                enforcer=interaction.user
-            )
-            
-        except Exception as e:
-            print(f"[ERROR] [{PRINT_PREFIX}] Error unblacklisting user {user.id}: {e}")
+        success = await asyncio.to_thread(users.remove_leader_blacklist, user.id)
+        if not success:
             embed = create_error_embed(
                 title="Unblacklist Error",
-                description=f"An unexpected error occurred while unblacklisting the user: {e}",
+                description=f"Failed to remove {user.mention} from the blacklist database.",
             )
+            await interaction.followup.send(embed=embed)
+            return
+        
+        # Success
+        embed = create_success_embed(
+            title="User Unblacklisted",
+            description=f"Successfully removed {user.mention} from the leader promotion blacklist.",
+        )
+        print(_INFO + f"Unblacklisted user {user.id} from leader promotions by {interaction.user.id}.")
+        
+        # Log to leader logs
+        await log_to_leader_logs(
+            title="Blacklist",
+            description=f"{user.mention} was removed from the leader promotion blacklist.",
+            enforcer=interaction.user
+        )
         
         await interaction.followup.send(embed=embed)
 
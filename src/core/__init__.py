@@ -20,8 +20,9 @@
 # If None is passed, it will wait indefinitely for the task to complete.
 
 # This allows the same function to be used with both the worker bot and the master bot seamlessly.
-# WORKER_QUEUE.get_worker() will return a worker bot in round robin fashion to distribute the load evenly, does not guarantee
-# that the worker isn't busy though, rate limits may still occur if all workers are busy.
+# WORKER_QUEUE.get_available_worker() hands out an idle worker (the least used one first), and the worker is put back on the
+# idle heap through WORKER_QUEUE.release_worker() once it has no task in flight. If every worker is busy, the running worker
+# with the fewest tasks in flight is used, so rate limits may still occur under heavy load.
 
 from . import channels # channel related core functionalities (channel perms, voice channel handling, message deleting, etc)
 from . import users # user related core functionalities (timeouts, bans, mutes, deafens, etc)
\ No newline at end of file
@@ -2,6 +2,11 @@
 # Channel creation related core functionalities (create text/voice channels, categories, stages, forums, etc)
 
 PRINT_PREFIX = "CORE - CHANNELS - CREATE"
+_INFO = f"[INFO] [{PRINT_PREFIX}] "
+_ERROR = f"[ERROR] [{PRINT_PREFIX}] "
+
+# Standard library imports
+import time
 
 # Third-party imports
 import discord
@@ -9,7 +14,78 @@ import discord
 # Local imports
 from config.env_vars import HOME_GUILD_ID
 from src.core.decorators import offload_fallback_return
-from src.core.fetching import get_guild_or_fetch, get_channel_or_fetch
+from src.core.fetching import get_guild_cached, get_channel_or_fetch
+
+_CATEGORY_CACHE_TTL = 30.0 # Seconds a resolved category is reused, categories are long-lived
+_CATEGORY_CACHE: dict[int, tuple[float, discord.CategoryChannel]] = {} # Category ID -> (stored at, category)
+
+async def _resolve_category(guild: discord.Guild, category_id: int) -> discord.CategoryChannel | None:
+    """
+    Resolves and validates a category channel, reusing recent results across bursts of channel creations.
+    
+    Args:
+        guild (discord.Guild): The guild to get the category from.
+        category_id (int): The ID of the category.
+    
+    Returns:
+        discord.CategoryChannel | None: The category, or None if not found or not a category channel.
+    """
+    cached = _CATEGORY_CACHE.get(category_id)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _CATEGORY_CACHE_TTL:
+        return cached[1]
+
+    category = await get_channel_or_fetch(guild, category_id)
+    if type(category) is not discord.CategoryChannel: # Exact type, discord.py does not subclass it (also covers None)
+        print(_ERROR + f"Category with ID {category_id} not found or is not a category channel.")
+        return None
+    _CATEGORY_CACHE[category_id] = (now, category)
+    return category
+
+# Kind -> (guild method, log label)
+_CHANNEL_KINDS: dict[str, tuple[str, str]] = {
+    "text": ("create_text_channel", "text channel"),
+    "voice": ("create_voice_channel", "voice channel"),
+    "category": ("create_category", "category channel"),
+    "forum": ("create_forum", "forum channel"),
+    "stage": ("create_stage_channel", "stage channel"),
+}
+
+async def _create_channel(bot, kind: str, name: str, category_id: int | None, overwrites: dict | None, reason: str) -> discord.abc.GuildChannel | None:
+    """
+    Shared implementation of the create_* functions below.
+    
+    Args:
+        bot: The bot instance to use.
+        kind (str): Key of _CHANNEL_KINDS.
+        name (str): The name of the channel to create.
+        category_id (int | None): The ID of the category to create the channel in, None for no category.
+        overwrites (dict | None): A dict of permission overwrites {role/member: PermissionOverwrite}.
+        reason (str): Reason for creating the channel.
+    
+    Returns:
+        discord.abc.GuildChannel | None: The created channel, or None if creation failed.
+    """
+    method, label = _CHANNEL_KINDS[kind]
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
+    if guild is None:
+        print(_ERROR + f"Guild with ID {HOME_GUILD_ID} not found.")
+        return None
+
+    extra = {}
+    if category_id is not None:
+        category = await _resolve_category(guild, category_id)
+        if category is None:
+            return None
+        extra["category"] = category
+    
+    try:
+        channel = await getattr(guild, method)(name=name, overwrites=overwrites, reason=reason, **extra)
+        print(_INFO + f"Created {label} '{name}' in guild {HOME_GUILD_ID}.")
+        return channel
+    except Exception as e:
+        print(_ERROR + f"Failed to create {label} '{name}' in guild {HOME_GUILD_ID}: {e}")
+        return None
 
 @offload_fallback_return(PRINT_PREFIX)
 async def create_text_channel(bot, /, channel_name: str, category_id: int = None, overwrites: dict = None, reason: str = "No reason provided", task_timeout: int = 10) -> discord.TextChannel | None:
@@ -30,25 +106,7 @@ async def create_text_channel(bot, /, channel_name: str, category_id: int = None
     Returns:
         discord.TextChannel | None: The created text channel, or None if creation failed.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
-    if guild is None:
-        print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
-        return None
-
-    category = None
-    if category_id is not None:
-        category = await get_channel_or_fetch(guild, category_id)
-        if category is None or not isinstance(category, discord.CategoryChannel):
-            print(f"[ERROR] [{PRINT_PREFIX}] Category with ID {category_id} not found or is not a category channel.")
-            return None
-    
-    try:
-        channel = await guild.create_text_channel(name=channel_name, category=category, overwrites=overwrites, reason=reason)
-        print(f"[INFO] [{PRINT_PREFIX}] Created text channel '{channel_name}' in guild {HOME_GUILD_ID}.")
-        return channel
-    except Exception as e:
-        print(f"[ERROR] [{PRINT_PREFIX}] Failed to create text channel '{channel_name}' in guild {HOME_GUILD_ID}: {e}")
-        return None
+    return await _create_channel(bot, "text", channel_name, category_id, overwrites, reason)
 
 @offload_fallback_return(PRINT_PREFIX)
 async def create_voice_channel(bot, /, channel_name: str, category_id: int = None, overwrites: dict = None, reason: str = "No reason provided", task_timeout: int = 10) -> discord.VoiceChannel | None:
@@ -68,26 +126,8 @@ async def create_voice_channel(bot, /, channel_name: str, category_id: int = Non
     Returns:
         discord.VoiceChannel | None: The created voice channel, or None if creation failed
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
-    if guild is None:
-        print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
-        return None
+    return await _create_channel(bot, "voice", channel_name, category_id, overwrites, reason)
 
-    category = None
-    if category_id is not None:
-        category = await get_channel_or_fetch(guild, category_id)
-        if category is None or not isinstance(category, discord.CategoryChannel):
-            print(f"[ERROR] [{PRINT_PREFIX}] Category with ID {category_id} not found or is not a category channel.")
-            return None
-    
-    try:
-        channel = await guild.create_voice_channel(name=channel_name, category=category, overwrites=overwrites, reason=reason)
-        print(f"[INFO] [{PRINT_PREFIX}] Created voice channel '{channel_name}' in guild {HOME_GUILD_ID}.")
-        return channel
-    except Exception as e:
-        print(f"[ERROR] [{PRINT_PREFIX}] Failed to create voice channel '{channel_name}' in guild {HOME_GUILD_ID}: {e}")
-        return None
-    
 @offload_fallback_return(PRINT_PREFIX)
 async def create_category_channel(bot, /, category_name: str, overwrites: dict = None, reason: str = "No reason provided", task_timeout: int = 10) -> discord.CategoryChannel | None:
     """
@@ -105,18 +145,7 @@ async def create_category_channel(bot, /, category_name: str, overwrites: dict =
     Returns:
         discord.CategoryChannel | None: The created category channel, or None if creation failed.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
-    if guild is None:
-        print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
-        return None
-
-    try:
-        category = await guild.create_category(name=category_name, overwrites=overwrites, reason=reason)
-        print(f"[INFO] [{PRINT_PREFIX}] Created category channel '{category_name}' in guild {HOME_GUILD_ID}.")
-        return category
-    except Exception as e:
-        print(f"[ERROR] [{PRINT_PREFIX}] Failed to create category channel '{category_name}' in guild {HOME_GUILD_ID}: {e}")
-        return None
+    return await _create_channel(bot, "category", category_name, None, overwrites, reason)
 
 @offload_fallback_return(PRINT_PREFIX)
 async def create_forum_channel(bot, /, channel_name: str, category_id: int = None, overwrites: dict = None, reason: str = "No reason provided", task_timeout: int = 10) -> discord.ForumChannel | None:
@@ -136,25 +165,7 @@ async def create_forum_channel(bot, /, channel_name: str, category_id: int = Non
     Returns:
         discord.ForumChannel | None: The created forum channel, or None if creation failed.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
-    if guild is None:
-        print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
-        return None
-
-    category = None
-    if category_id is not None:
-        category = await get_channel_or_fetch(guild, category_id)
-        if category is None or not isinstance(category, discord.CategoryChannel):
-            print(f"[ERROR] [{PRINT_PREFIX}] Category with ID {category_id} not found or is not a category channel.")
-            return None
-    
-    try:
-        channel = await guild.create_forum(name=channel_name, category=category, overwrites=overwrites, reason=reason)
-        print(f"[INFO] [{PRINT_PREFIX}] Created forum channel '{channel_name}' in guild {HOME_GUILD_ID}.")
-        return channel
-    except Exception as e:
-        print(f"[ERROR] [{PRINT_PREFIX}] Failed to create forum channel '{channel_name}' in guild {HOME_GUILD_ID}: {e}")
-        return None
+    return await _create_channel(bot, "forum", channel_name, category_id, overwrites, reason)
 
 @offload_fallback_return(PRINT_PREFIX)
 async def create_stage_channel(bot, /, channel_name: str, category_id: int = None, overwrites: dict = None, reason: str = "No reason provided", task_timeout: int = 10) -> discord.StageChannel | None:
@@ -174,22 +185,4 @@ async def create_stage_channel(bot, /, channel_name: str, category_id: int = Non
     Returns:
         discord.StageChannel | None: The created stage channel, or None if creation failed.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
-    if guild is None:
-        print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
-        return None
-
-    category = None
-    if category_id is not None:
-        category = await get_channel_or_fetch(bot, guild, category_id)
-        if category is None or not isinstance(category, discord.CategoryChannel):
-            print(f"[ERROR] [{PRINT_PREFIX}] Category with ID {category_id} not found or is not a category channel.")
-            return None
-    
-    try:
-        channel = await guild.create_stage_channel(name=channel_name, category=category, overwrites=overwrites, reason=reason)
-        print(f"[INFO] [{PRINT_PREFIX}] Created stage channel '{channel_name}' in guild {HOME_GUILD_ID}.")
-        return channel
-    except Exception as e:
-        print(f"[ERROR] [{PRINT_PREFIX}] Failed to create stage channel '{channel_name}' in guild {HOME_GUILD_ID}: {e}")
-        return None
\ No newline at end of file
+    return await _create_channel(bot, "stage", channel_name, category_id, overwrites, reason)
\ No newline at end of file
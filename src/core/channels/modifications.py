@@ -2,6 +2,11 @@
 # Channel modification related core functionalities (modify text/voice channels, categories, stages, forums, etc)
 
 PRINT_PREFIX = "CORE - CHANNELS - MODIFICATIONS"
+_INFO = f"[INFO] [{PRINT_PREFIX}] "
+_ERROR = f"[ERROR] [{PRINT_PREFIX}] "
+
+# Standard library imports
+import asyncio
 
 # Third-party imports
 import discord
@@ -9,12 +14,69 @@ import discord
 # Local imports
 from config.env_vars import HOME_GUILD_ID
 from src.core.decorators import offload_fallback
-from src.core.fetching import get_guild_or_fetch, get_channel_or_fetch
+from src.core.fetching import get_guild_cached, get_channel_or_fetch
 
-@offload_fallback(PRINT_PREFIX)
-async def rename_channel(bot: discord.Client, /, channel_id: int, new_name: str, reason: str = "No reason provided", task_timeout: int = 10) -> bool:
+class _PendingRename:
+    """A rename waiting for its channel's lock, later calls overwrite the name and share the future."""
+    def __init__(self, new_name: str, reason: str, task_timeout: int | None):
+        self.new_name = new_name
+        self.reason = reason
+        self.task_timeout = task_timeout
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.task: asyncio.Task | None = None # Kept here so the running task stays referenced
+
+# Both live on the caller's loop
+_RENAME_LOCKS: dict[int, asyncio.Lock] = {} # Channel ID -> lock, renames of one channel run one at a time
+_PENDING_RENAMES: dict[int, _PendingRename] = {} # Channel ID -> newest rename not started yet
+
+async def _run_rename(channel_id: int, pending: _PendingRename) -> None:
+    """Waits for the channel's lock, then applies the newest pending name and resolves every caller sharing it."""
+    lock = _RENAME_LOCKS.setdefault(channel_id, asyncio.Lock())
+    async with lock:
+        # Started, calls from here on queue a new pending rename behind this one
+        _PENDING_RENAMES.pop(channel_id, None)
+        try:
+            result = await _rename_channel(channel_id=channel_id, new_name=pending.new_name, reason=pending.reason, task_timeout=pending.task_timeout)
+        except Exception as e:
+            pending.future.set_exception(e)
+        else:
+            pending.future.set_result(result)
+    if channel_id not in _PENDING_RENAMES and not lock.locked():
+        _RENAME_LOCKS.pop(channel_id, None) # Nothing queued behind, drop the lock
+
+async def rename_channel(channel_id: int, new_name: str, reason: str = "No reason provided", task_timeout: int = 10) -> bool:
     """
     Renames a channel in the home guild.
+    Renames of the same channel run in call order, calls made while one is running are coalesced into a single
+    request using the newest name (so the channel always ends up with the last requested name).
+    
+    Args:
+        channel_id (int): The ID of the channel to rename.
+        new_name (str): The new name for the channel.
+        reason (str): Reason for renaming the channel.
+        task_timeout (int): Timeout for the task execution:
+            None: Will wait indefinitely.
+            0: Will not wait at all, fire-and-forget.
+            >0: Will wait up to N seconds.
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    pending = _PENDING_RENAMES.get(channel_id)
+    if pending is not None:
+        pending.new_name = new_name
+        pending.reason = reason
+        pending.task_timeout = task_timeout
+    else:
+        pending = _PendingRename(new_name, reason, task_timeout)
+        _PENDING_RENAMES[channel_id] = pending
+        pending.task = asyncio.ensure_future(_run_rename(channel_id, pending))
+    # Shielded so one caller being cancelled doesn't cancel the rename for the others
+    return await asyncio.shield(pending.future)
+
+@offload_fallback(PRINT_PREFIX)
+async def _rename_channel(bot: discord.Client, /, channel_id: int, new_name: str, reason: str = "No reason provided", task_timeout: int = 10) -> bool:
+    """
+    Renames a channel in the home guild, use rename_channel instead.
     
     Args:
         bot: The bot instance to use. (auto offloaded to worker or master bot, don't pass manually)
@@ -29,22 +91,22 @@ async def rename_channel(bot: discord.Client, /, channel_id: int, new_name: str,
         bool: True if successful, False otherwise.
     """
 
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
-        print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
+        print(_ERROR + f"Guild with ID {HOME_GUILD_ID} not found.")
         return False
 
     channel = await get_channel_or_fetch(guild, channel_id)
     if channel is None:
-        print(f"[ERROR] [{PRINT_PREFIX}] Channel with ID {channel_id} not found in guild {HOME_GUILD_ID}.")
+        print(_ERROR + f"Channel with ID {channel_id} not found in guild {HOME_GUILD_ID}.")
         return False
 
     try:
         await channel.edit(name=new_name, reason=reason)
-        print(f"[INFO] [{PRINT_PREFIX}] Renamed channel {channel_id} to '{new_name}' in guild {HOME_GUILD_ID}.")
+        print(_INFO + f"Renamed channel {channel_id} to '{new_name}' in guild {HOME_GUILD_ID}.")
         return True
     except Exception as e:
-        print(f"[ERROR] [{PRINT_PREFIX}] Failed to rename channel {channel_id} in guild {HOME_GUILD_ID}: {e}")
+        print(_ERROR + f"Failed to rename channel {channel_id} in guild {HOME_GUILD_ID}: {e}")
         return False
 
 @offload_fallback(PRINT_PREFIX)
@@ -66,22 +128,79 @@ async def set_channel_permission(bot: discord.Client, /, channel_id: int, target
         bool: True if successful, False otherwise.
     """
 
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
-        print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
+        print(_ERROR + f"Guild with ID {HOME_GUILD_ID} not found.")
         return False
 
     channel = await get_channel_or_fetch(guild, channel_id)
     if channel is None:
-        print(f"[ERROR] [{PRINT_PREFIX}] Channel with ID {channel_id} not found in guild {HOME_GUILD_ID}.")
+        print(_ERROR + f"Channel with ID {channel_id} not found in guild {HOME_GUILD_ID}.")
         return False
 
     try:
         await channel.set_permissions(target, overwrite=overwrite, reason=reason)
-        print(f"[INFO] [{PRINT_PREFIX}] Set permissions for target {target} in channel {channel_id} in guild {HOME_GUILD_ID}.")
+        print(_INFO + f"Set permissions for target {target} in channel {channel_id} in guild {HOME_GUILD_ID}.")
         return True
     except Exception as e:
-        print(f"[ERROR] [{PRINT_PREFIX}] Failed to set permissions for target {target} in channel {channel_id} in guild {HOME_GUILD_ID}: {e}")
+        print(_ERROR + f"Failed to set permissions for target {target} in channel {channel_id} in guild {HOME_GUILD_ID}: {e}")
+        return False
+
+def _merge_overwrites(current: dict, mapping: dict) -> dict:
+    """
+    Applies mapping on top of a channel's current overwrites, matching targets by ID
+    (so a discord.Object replaces the Role/Member with the same ID). A None overwrite removes the target.
+    
+    Args:
+        current (dict): The channel's current {role/member: PermissionOverwrite}.
+        mapping (dict): {role/member/Object: PermissionOverwrite | None} changes to apply.
+    Returns:
+        dict: The merged {role/member/Object: PermissionOverwrite}.
+    """
+    merged = {target.id: (target, overwrite) for target, overwrite in current.items()}
+    for target, overwrite in mapping.items():
+        if overwrite is None:
+            merged.pop(target.id, None)
+        else:
+            existing = merged.get(target.id)
+            merged[target.id] = (existing[0] if existing else target, overwrite) # Keep the resolved Role/Member when there is one
+    return dict(merged.values())
+
+@offload_fallback(PRINT_PREFIX)
+async def set_channel_permissions_bulk(bot: discord.Client, /, channel_id: int, mapping: dict[discord.Role | discord.Member | discord.Object, discord.PermissionOverwrite | None], reason: str = "No reason provided", task_timeout: int = 10) -> bool:
+    """
+    Sets permission overwrites for several roles/members on a channel in a single request.
+    Same result as calling set_channel_permission once per target, existing overwrites for other targets are kept.
+    
+    Args:
+        bot: The bot instance to use. (auto offloaded to worker or master bot, don't pass manually)
+        channel_id (int): The ID of the channel to modify.
+        mapping (dict): {role/member/Object: PermissionOverwrite | None} overwrites to apply, None clears the target's overwrite.
+        reason (str): Reason for modifying the permissions.
+        task_timeout (int): Timeout for the task execution:
+            None: Will wait indefinitely.
+            0: Will not wait at all, fire-and-forget.
+            >0: Will wait up to N seconds.
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
+    if guild is None:
+        print(_ERROR + f"Guild with ID {HOME_GUILD_ID} not found.")
+        return False
+
+    channel = await get_channel_or_fetch(guild, channel_id)
+    if channel is None:
+        print(_ERROR + f"Channel with ID {channel_id} not found in guild {HOME_GUILD_ID}.")
+        return False
+
+    try:
+        await channel.edit(overwrites=_merge_overwrites(channel.overwrites, mapping), reason=reason)
+        print(_INFO + f"Set permissions for {len(mapping)} target(s) in channel {channel_id} in guild {HOME_GUILD_ID}.")
+        return True
+    except Exception as e:
+        print(_ERROR + f"Failed to set permissions for {len(mapping)} target(s) in channel {channel_id} in guild {HOME_GUILD_ID}: {e}")
         return False
     
 @offload_fallback(PRINT_PREFIX)
@@ -102,28 +221,20 @@ async def set_channel_status(bot: discord.Client, /, channel_id: int, new_status
         bool: True if successful, False otherwise.
     """
 
-    guild = bot.get_guild(HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
-        try:
-            guild = await bot.fetch_guild(HOME_GUILD_ID)
-        except Exception as e:
-            print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found: {e}")
-            return False
+        print(_ERROR + f"Guild with ID {HOME_GUILD_ID} not found.")
+        return False
 
-    channel = guild.get_channel(channel_id)
-    if channel is None:
-        try:
-            channel = await guild.fetch_channel(channel_id)
-        except Exception:
-            pass
+    channel = await get_channel_or_fetch(guild, channel_id)
     if channel is None or not isinstance(channel, discord.StageChannel):
-        print(f"[ERROR] [{PRINT_PREFIX}] Stage channel with ID {channel_id} not found in guild {HOME_GUILD_ID}.")
+        print(_ERROR + f"Stage channel with ID {channel_id} not found in guild {HOME_GUILD_ID}.")
         return False
 
     try:
-        channel.edit(status=new_status, reason=reason)
-        print(f"[INFO] [{PRINT_PREFIX}] Changed status of stage channel {channel_id} to '{new_status}' in guild {HOME_GUILD_ID}.")
+        await channel.edit(status=new_status, reason=reason)
+        print(_INFO + f"Changed status of stage channel {channel_id} to '{new_status}' in guild {HOME_GUILD_ID}.")
         return True
     except Exception as e:
-        print(f"[ERROR] [{PRINT_PREFIX}] Failed to change status of stage channel {channel_id} in guild {HOME_GUILD_ID}: {e}")
+        print(_ERROR + f"Failed to change status of stage channel {channel_id} in guild {HOME_GUILD_ID}: {e}")
         return False
\ No newline at end of file
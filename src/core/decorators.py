@@ -3,12 +3,29 @@
 
 # Standard library imports
 import asyncio
+import random
 from functools import wraps
 
 # Local imports
-from src.workers import WORKER_QUEUE
+from src.workers import WORKER_QUEUE, WorkerDispatchError
 from src.bot import bot as master_bot
 
+_MAX_WORKER_ATTEMPTS = 3 # Dispatch attempts across workers before falling back to the master bot
+_BACKOFF_BASE = 0.5 # Seconds, doubled per attempt
+_BACKOFF_CAP = 4.0 # Seconds, upper bound for a single backoff
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given (0-based) attempt."""
+    return min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** attempt) + random.uniform(0, _BACKOFF_BASE)
+
+_BACKGROUND_TASKS: set[asyncio.Task] = set() # Strong references to fire-and-forget dispatches until they finish
+
+def _spawn_background(coro) -> None:
+    """Runs a coroutine as a detached task, keeping a reference so it isn't garbage collected mid-run."""
+    task = asyncio.ensure_future(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
 def offload_fallback(print_prefix: str):
     """
     Decorator to offload a function to an available worker.
@@ -23,25 +40,28 @@ def offload_fallback(print_prefix: str):
     def decorator(func: callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Try to get an available worker
-            worker = WORKER_QUEUE.get_worker()
-            loop = asyncio.get_running_loop()
-
             success = False
             
             # Extract task_timeout from kwargs to pass to execute_task
             task_timeout = kwargs.pop('task_timeout', None)
+            if task_timeout == 0:
+                # Fire-and-forget, the whole dispatch (including the master fallback) runs detached
+                _spawn_background(wrapper(*args, task_timeout=None, **kwargs))
+                return True
 
-            if worker:
+            # Only retry when the task could not be scheduled, it never ran so retrying can't repeat side effects
+            for attempt in range(_MAX_WORKER_ATTEMPTS):
+                worker = WORKER_QUEUE.get_available_worker()
+                if not worker:
+                    break
                 try:
-                    # Offload the task to the worker
-                    # run_in_executor doesn't support kwargs, so we wrap the call
-                    success = await loop.run_in_executor(
-                        None,
-                        lambda: worker.execute_task(func, task_timeout, *args, **kwargs)
-                    )
-                except Exception as e:
-                    print(f"[ERROR] [{print_prefix}] Offloading to worker failed: {e}")
+                    # Offload the task to the worker, awaited directly on its loop (no executor thread hop)
+                    success = await worker.execute_task_async(func, task_timeout, *args, **kwargs)
+                    break
+                except WorkerDispatchError as e:
+                    print(f"[ERROR] [{print_prefix}] Offloading to worker failed (attempt {attempt + 1}/{_MAX_WORKER_ATTEMPTS}): {e}")
+                    if attempt + 1 < _MAX_WORKER_ATTEMPTS:
+                        await asyncio.sleep(_backoff_delay(attempt))
 
             if not success:
                 print(f"[WARNING] [{print_prefix}] Offloading to worker failed or no worker available. Falling back to master bot.")
@@ -66,25 +86,28 @@ def offload_fallback_return(print_prefix: str):
     def decorator(func: callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Try to get an available worker
-            worker = WORKER_QUEUE.get_available_worker()
-            loop = asyncio.get_running_loop()
-
             result = None
             
             # Extract task_timeout from kwargs to pass to execute_task_return
             task_timeout = kwargs.pop('task_timeout', None)
+            if task_timeout == 0:
+                # Fire-and-forget, the whole dispatch (including the master fallback) runs detached
+                _spawn_background(wrapper(*args, task_timeout=None, **kwargs))
+                return None
 
-            if worker:
+            # Only retry when the task could not be scheduled, it never ran so retrying can't repeat side effects
+            for attempt in range(_MAX_WORKER_ATTEMPTS):
+                worker = WORKER_QUEUE.get_available_worker()
+                if not worker:
+                    break
                 try:
-                    # Offload the task to the worker
-                    # run_in_executor doesn't support kwargs, so we wrap the call
-                    result = await loop.run_in_executor(
-                        None,
-                        lambda: worker.execute_task_return(func, task_timeout, *args, **kwargs)
-                    )
-                except Exception as e:
-                    print(f"[ERROR] [{print_prefix}] Offloading to worker failed: {e}")
+                    # Offload the task to the worker, awaited directly on its loop (no executor thread hop)
+                    result = await worker.execute_task_return_async(func, task_timeout, *args, **kwargs)
+                    break
+                except WorkerDispatchError as e:
+                    print(f"[ERROR] [{print_prefix}] Offloading to worker failed (attempt {attempt + 1}/{_MAX_WORKER_ATTEMPTS}): {e}")
+                    if attempt + 1 < _MAX_WORKER_ATTEMPTS:
+                        await asyncio.sleep(_backoff_delay(attempt))
 
             if result is None:
                 print(f"[WARNING] [{print_prefix}] Offloading to worker failed or no worker available. Falling back to master bot.")
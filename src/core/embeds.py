@@ -2,37 +2,88 @@
 # Core embed functionalities, such as creating and modifying embeds.
 
 PRINT_PREFIX = "CORE - EMBEDS"
+_DEBUG = f"[DEBUG] [{PRINT_PREFIX}] "
+
+# Standard library imports
+from contextvars import ContextVar
+from datetime import datetime
+from functools import lru_cache
 
 # Third-party imports
-from dis import disco
-import dis
 from typing import Literal
 import discord
 
 # Local imports
-from config.env_vars import BOT_NAME
+from config.env_vars import BOT_NAME, DEBUG_ENABLED
 from src.bot import bot
-from src.db.bot_db.wins import get_wins_by_user
 
-def _get_base_embed(title: str, module: str, color: str) -> discord.Embed:
+# Parsed once at import, embeds reuse a small fixed set of colors
+_SUCCESS_COLOR = discord.Color.from_str("#21C447")
+_ERROR_COLOR = discord.Color.from_str("#B92323")
+_DEFAULT_COLOR = discord.Color.from_str("#111111")
+_LEADER_LOG_COLORS: dict[str, discord.Color] = {
+    "Demotion": _ERROR_COLOR,
+    "Promotion": discord.Color.from_str("#2196C4"),
+    "Role Added": _SUCCESS_COLOR,
+    "Role Removed": _ERROR_COLOR,
+    "Blacklist": _DEFAULT_COLOR,
+}
+
+@lru_cache(maxsize=512)
+def _format_title(prefix: str, title: str) -> str:
+    """Prepends the emoji prefix and autocapitalizes each word, titles repeat so results are cached."""
+    return f"{prefix} {' '.join(word.capitalize() for word in title.split())}"
+
+_LEADER_TITLES: dict[str, str] = {title: _format_title("📝", title) for title in _LEADER_LOG_COLORS}
+_FOOTER_TEXT = f"{BOT_NAME}"
+_footer_icon_url: str | None = None # Set by init_embed_constants on ready, bot.user is only set after login
+
+_NOW: ContextVar[datetime | None] = ContextVar("_NOW", default=None) # Timestamp pinned for the current command, if any
+
+def pin_embed_timestamp() -> datetime:
+    """Pins the embed timestamp for the current command (task), so every embed it builds shares one timestamp.
+    Call at the start of a command handler.
+    """
+    now = discord.utils.utcnow()
+    _NOW.set(now)
+    return now
+
+def embed_timestamp() -> datetime:
+    """Returns the pinned timestamp for the current command, or the current time if none was pinned."""
+    return _NOW.get() or discord.utils.utcnow()
+
+def init_embed_constants(bot: discord.Client) -> None:
+    """Caches values that need a logged in bot (footer icon URL). Call from on_ready, reconnects refresh it."""
+    global _footer_icon_url
+    _footer_icon_url = bot.user.display_avatar.url
+
+def _get_footer_icon_url() -> str:
+    """Returns the bot avatar URL used in embed footers, falls back to resolving it if on_ready has not run yet."""
+    global _footer_icon_url
+    if _footer_icon_url is None:
+        _footer_icon_url = bot.user.display_avatar.url
+    return _footer_icon_url
+
+def _get_base_embed(title: str, module: str, color: discord.Color) -> discord.Embed:
     """
     Creates a base embed with standard formatting.
 
     Args:
         title (str): The title of the embed.
         module (str): The module name for footer context.
-        color (str): The color of the embed in hex format.
+        color (discord.Color): The color of the embed.
     
     Returns:
         discord.Embed: The base embed object.
     """
     embed = discord.Embed(
         title=title,
-        color=discord.Color.from_str(color),
-        timestamp=discord.utils.utcnow()
+        color=color,
+        timestamp=embed_timestamp()
     )
-    embed.set_footer(text=f"{BOT_NAME} - {module}", icon_url=bot.user.display_avatar.url)
-    print(f"[DEBUG] [{PRINT_PREFIX}] Created base embed with title '{title}' for module '{module}'")
+    embed.set_footer(text=f"{BOT_NAME} - {module}", icon_url=_get_footer_icon_url())
+    if DEBUG_ENABLED:
+        print(_DEBUG + f"Created base embed with title '{title}' for module '{module}'")
     return embed
 
 def create_leader_log_embed(title: Literal["Demotion", "Promotion", "Role Added", "Role Removed", "Blacklist"], description: str, enforcer: discord.User | None = None) -> discord.Embed:
@@ -48,28 +99,22 @@ def create_leader_log_embed(title: Literal["Demotion", "Promotion", "Role Added"
         discord.Embed: The leader log embed object.
     """
 
-    color_map = {
-        "Demotion": "#B92323",
-        "Promotion": "#2196C4",
-        "Role Added": "#21C447",
-        "Role Removed": "#B92323",
-        "Blacklist": "#111111"
-    }
-    color = color_map.get(title, "#111111")
+    color = _LEADER_LOG_COLORS.get(title, _DEFAULT_COLOR)
 
     embed = discord.Embed(
-        title=f"📝 {' '.join(word.capitalize() for word in title.split())}",
+        title=_LEADER_TITLES.get(title) or _format_title("📝", title),
         description=description,
-        color=discord.Color.from_str(color),
-        timestamp=discord.utils.utcnow()
+        color=color,
+        timestamp=embed_timestamp()
     )
     if enforcer:
         embed.set_author(
             name=f"Enforced by {enforcer.display_name}",
             icon_url=enforcer.display_avatar.url if enforcer.display_avatar else discord.Embed.Empty
         )
-    embed.set_footer(text=f"{BOT_NAME} - Leaders", icon_url=bot.user.display_avatar.url)
-    print(f"[DEBUG] [{PRINT_PREFIX}] Created leader log embed with title '{title}' and description '{description}'")
+    embed.set_footer(text=f"{BOT_NAME} - Leaders", icon_url=_get_footer_icon_url())
+    if DEBUG_ENABLED:
+        print(_DEBUG + f"Created leader log embed with title '{title}' and description '{description}'")
     return embed
 
 def create_success_embed(title: str, description: str) -> discord.Embed:
@@ -86,13 +131,14 @@ def create_success_embed(title: str, description: str) -> discord.Embed:
         discord.Embed: The success embed object.
     """
     embed = discord.Embed(
-        title=f"✅ {' '.join(word.capitalize() for word in title.split())}",
+        title=_format_title("✅", title),
         description=description,
-        color=discord.Color.from_str("#21C447"),
-        timestamp=discord.utils.utcnow()
+        color=_SUCCESS_COLOR,
+        timestamp=embed_timestamp()
     )
-    embed.set_footer(text=f"{BOT_NAME}", icon_url=bot.user.display_avatar.url)
-    print(f"[DEBUG] [{PRINT_PREFIX}] Created success embed with title '{title}' and description '{description}'")
+    embed.set_footer(text=_FOOTER_TEXT, icon_url=_get_footer_icon_url())
+    if DEBUG_ENABLED:
+        print(_DEBUG + f"Created success embed with title '{title}' and description '{description}'")
     return embed
 
 def create_error_embed(title: str, description: str) -> discord.Embed:
@@ -109,16 +155,17 @@ def create_error_embed(title: str, description: str) -> discord.Embed:
         discord.Embed: The error embed object.
     """
     embed = discord.Embed(
-        title=f"❌ {' '.join(word.capitalize() for word in title.split())}",
+        title=_format_title("❌", title),
         description=description,
-        color=discord.Color.from_str("#B92323"),
-        timestamp=discord.utils.utcnow()
+        color=_ERROR_COLOR,
+        timestamp=embed_timestamp()
     )
-    embed.set_footer(text=f"{BOT_NAME}", icon_url=bot.user.display_avatar.url)
-    print(f"[DEBUG] [{PRINT_PREFIX}] Created error embed with title '{title}' and description '{description}'")
+    embed.set_footer(text=_FOOTER_TEXT, icon_url=_get_footer_icon_url())
+    if DEBUG_ENABLED:
+        print(_DEBUG + f"Created error embed with title '{title}' and description '{description}'")
     return embed
 
-def create_leader_info_embed(user: discord.User, leader_data: dict, user_wins: list[dict], role: discord.Role) -> discord.Embed:
+def create_leader_info_embed(user: discord.User, leader_data: dict, user_wins_count: int, role: discord.Role) -> discord.Embed:
     """
     Creates an embed displaying leader information for a user.
     Args:
@@ -131,19 +178,18 @@ def create_leader_info_embed(user: discord.User, leader_data: dict, user_wins: l
             "promoted_at": int,
             "on_break_since": int 
         }
-        user_wins (list[dict]): A list of dictionaries representing the user's wins.
+        user_wins_count (int): The number of wins the user has.
         role (discord.Role): The Discord role associated with the user's leader tier.
     """
-    DEFAULT_COLOR = "#111111"
-    embed_color = hex(role.color.value) if role else DEFAULT_COLOR
+    embed_color = role.color if role else _DEFAULT_COLOR
     
-    if embed_color == DEFAULT_COLOR:
+    if role is None:
         print(f"[WARNING] [{PRINT_PREFIX}] Role color not found or default for user_id {leader_data.get('user_id', 'N/A')}. Role ID: {role.id if role else 'N/A'} Role Name: {role.name if role else 'N/A'}")
     
     embed = _get_base_embed(
         title="👤 Leader Profile",
         module="Leaders",
-        color=str(embed_color)
+        color=embed_color
     )
 
     embed.set_author(
@@ -151,13 +197,10 @@ def create_leader_info_embed(user: discord.User, leader_data: dict, user_wins: l
         icon_url=user.display_avatar.url if user.display_avatar else discord.Embed.Empty
     )
 
-    last_win = leader_data.get("last_win_at")
-    last_win = None if last_win == 0 else last_win
-
-    last_host = leader_data.get("last_host_at")
-    last_host = None if last_host == 0 else last_host
-
-    promoted_at = leader_data.get("promoted_at")
+    # Single read per field, 0 means never
+    last_win = leader_data.get("last_win_at") or None
+    last_host = leader_data.get("last_host_at") or None
+    promoted_at = leader_data.get("promoted_at") or None
 
     embed.add_field(
         name="⭐ Leader Tier",
@@ -167,22 +210,23 @@ def create_leader_info_embed(user: discord.User, leader_data: dict, user_wins: l
     
     embed.add_field(
         name="🏅 Wins",
-        value=str(len(user_wins)),
+        value=str(user_wins_count),
         inline=True
     )
 
     # Build activity value
-    activity_lines = [
-        f"**Last Win:** {f'<t:{int(last_win)}:R>' if last_win else 'N/A'}",
-        f"**Last Host:** {f'<t:{int(last_host)}:R>' if last_host else 'N/A'}",
-        f"**Last Tier Adjustment:** <t:{int(promoted_at)}:R>" if promoted_at else "N/A",
-    ]
+    activity = (
+        f"**Last Win:** {f'<t:{int(last_win)}:R>' if last_win else 'N/A'}\n"
+        f"**Last Host:** {f'<t:{int(last_host)}:R>' if last_host else 'N/A'}\n"
+        f"**Last Tier Adjustment:** {f'<t:{int(promoted_at)}:R>' if promoted_at else 'N/A'}"
+    )
     
     embed.add_field(
         name="⏱️ Last Activity",
-        value="\n".join(activity_lines),
+        value=activity,
         inline=False
     )
 
-    print(f"[DEBUG] [{PRINT_PREFIX}] Created leader info embed for user_id {leader_data.get('user_id', 'N/A')}")
+    if DEBUG_ENABLED:
+        print(_DEBUG + f"Created leader info embed for user_id {leader_data.get('user_id', 'N/A')}")
     return embed
@@ -1,9 +1,69 @@
 # src\core\_helpers.py
 # Helper functions for core module to handle cache-first with fetch fallback
 
+# Standard library imports
+import threading
+import time
+from collections import OrderedDict
+
 # Third-party imports
 import discord
 
+# Local imports
+from src.bot import bot as _master_bot
+
+_GUILD_CACHE_TTL = 30.0 # Seconds a resolved guild is reused by get_guild_cached
+_guild_cache: dict[tuple[int, int], tuple[float, discord.Guild]] = {} # (bot user ID, guild ID) -> (stored at, guild)
+
+_MISS_CACHE_TTL = 30.0 # Seconds a failed fetch is remembered, so unresolvable IDs don't hit the API on every call
+_MISS_CACHE_SIZE = 4096
+_miss_cache: OrderedDict[tuple, float] = OrderedDict() # ("guild", bot user ID, guild ID) / ("member" | "role", guild ID, ID) -> failed at
+_miss_lock = threading.Lock() # Master and worker bots use the cache from their own threads
+
+def _recently_missed(key: tuple) -> bool:
+    """Returns True if a fetch for this key failed within the last _MISS_CACHE_TTL seconds."""
+    with _miss_lock:
+        failed_at = _miss_cache.get(key)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at < _MISS_CACHE_TTL:
+            return True
+        _miss_cache.pop(key, None)
+        return False
+
+def _remember_miss(key: tuple) -> None:
+    """Records a failed fetch, evicting the oldest entries past _MISS_CACHE_SIZE."""
+    with _miss_lock:
+        _miss_cache[key] = time.monotonic()
+        _miss_cache.move_to_end(key)
+        while len(_miss_cache) > _MISS_CACHE_SIZE:
+            _miss_cache.popitem(last=False)
+
+def _forget_miss(key: tuple) -> None:
+    with _miss_lock:
+        _miss_cache.pop(key, None)
+
+def register_miss_cache_listeners(bot: discord.Client) -> None:
+    """Drops remembered fetch failures when the role, member or guild they refer to changes.
+    Call for every bot instance that uses the fetch helpers (the master bot is registered on import).
+    """
+    async def on_role_change(role: discord.Role) -> None:
+        _forget_miss(("role", role.guild.id, role.id))
+
+    async def on_member_change(member: discord.Member) -> None:
+        _forget_miss(("member", member.guild.id, member.id))
+
+    async def on_guild_change(guild: discord.Guild) -> None:
+        _forget_miss(("guild", bot.user.id, guild.id))
+
+    bot.add_listener(on_role_change, "on_guild_role_create")
+    bot.add_listener(on_role_change, "on_guild_role_delete")
+    bot.add_listener(on_member_change, "on_member_join")
+    bot.add_listener(on_member_change, "on_member_remove")
+    bot.add_listener(on_guild_change, "on_guild_join")
+    bot.add_listener(on_guild_change, "on_guild_remove")
+
+register_miss_cache_listeners(_master_bot)
 
 async def get_guild_or_fetch(bot: discord.Client, guild_id: int) -> discord.Guild | None:
     """
@@ -18,13 +78,42 @@ async def get_guild_or_fetch(bot: discord.Client, guild_id: int) -> discord.Guil
     """
     guild = bot.get_guild(guild_id)
     if guild is None:
+        key = ("guild", bot.user.id, guild_id)
+        if _recently_missed(key):
+            return None
         try:
             guild = await bot.fetch_guild(guild_id)
+        except (discord.NotFound, discord.Forbidden): # Only remember definite failures, not transient ones
+            _remember_miss(key)
         except Exception:
             pass
     return guild
 
 
+
+async def get_guild_cached(bot: discord.Client, guild_id: int) -> discord.Guild | None:
+    """
+    Same as get_guild_or_fetch, but reuses the resolved guild for a short time (per bot).
+    Meant for hot paths that resolve the same guild on every call.
+    
+    Args:
+        bot: The bot instance to use.
+        guild_id (int): The ID of the guild to get.
+    
+    Returns:
+        discord.Guild | None: The guild object, or None if not found.
+    """
+    key = (bot.user.id, guild_id)
+    cached = _guild_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _GUILD_CACHE_TTL:
+        return cached[1]
+
+    guild = await get_guild_or_fetch(bot, guild_id)
+    if guild is not None:
+        _guild_cache[key] = (now, guild)
+    return guild
+
 async def get_member_or_fetch(guild: discord.Guild, user_id: int) -> discord.Member | None:
     """
     Gets a member from cache, fetches if not found.
@@ -39,13 +128,52 @@ async def get_member_or_fetch(guild: discord.Guild, user_id: int) -> discord.Mem
     """
     member = guild.get_member(user_id)
     if member is None:
+        key = ("member", guild.id, user_id)
+        if _recently_missed(key):
+            return None
         try:
             member = await guild.fetch_member(user_id)
+        except (discord.NotFound, discord.Forbidden): # Only remember definite failures, not transient ones
+            _remember_miss(key)
         except Exception:
             pass
     return member
 
 
+async def get_members_or_fetch(guild: discord.Guild, user_ids: list[int]) -> dict[int, discord.Member]:
+    """
+    Bulk version of get_member_or_fetch, cache misses are resolved through the gateway 100 at a time
+    instead of one REST request per member.
+    
+    Args:
+        guild (discord.Guild): The guild to get the members from.
+        user_ids (list[int]): The IDs of the users to get.
+    
+    Returns:
+        dict[int, discord.Member]: User ID -> member, users that could not be found are left out.
+    """
+    members: dict[int, discord.Member] = {}
+    missing: list[int] = []
+    for user_id in user_ids:
+        member = guild.get_member(user_id)
+        if member is not None:
+            members[user_id] = member
+        else:
+            missing.append(user_id)
+
+    for i in range(0, len(missing), 100):
+        chunk = missing[i:i + 100]
+        try:
+            for member in await guild.query_members(user_ids=chunk, limit=100):
+                members[member.id] = member
+        except Exception:
+            # Gateway query failed (timeout etc), fall back to fetching the chunk one by one
+            for user_id in chunk:
+                member = await get_member_or_fetch(guild, user_id)
+                if member is not None:
+                    members[user_id] = member
+    return members
+
 async def get_channel_or_fetch(guild: discord.Guild, channel_id: int) -> discord.abc.GuildChannel | discord.Thread | None:
     """
     Gets a channel from cache, fetches if not found.
@@ -78,8 +206,13 @@ async def get_role_or_fetch(guild: discord.Guild, role_id: int) -> discord.Role
     """
     role = guild.get_role(role_id)
     if role is None:
+        key = ("role", guild.id, role_id)
+        if _recently_missed(key):
+            return None
         try:
             role = await guild.fetch_role(role_id)
+        except (discord.NotFound, discord.Forbidden): # Only remember definite failures, not transient ones
+            _remember_miss(key)
         except Exception:
             pass
     return role
\ No newline at end of file
@@ -14,6 +14,37 @@ from src.bot import bot
 from src.db import context_json
 import src.core.embeds as embeds
 
+_leader_log_channel: discord.TextChannel | None = None # Last resolved leader logs channel, checked against the configured ID
+
+async def _invalidate_leader_log_channel(channel: discord.abc.GuildChannel, *_) -> None:
+    """Drop the cached leader logs channel when it is updated or deleted."""
+    global _leader_log_channel
+    if _leader_log_channel is not None and channel.id == _leader_log_channel.id:
+        _leader_log_channel = None
+
+bot.add_listener(_invalidate_leader_log_channel, "on_guild_channel_update")
+bot.add_listener(_invalidate_leader_log_channel, "on_guild_channel_delete")
+
+async def _resolve_leader_log_channel(channel_id: int) -> discord.TextChannel | None:
+    """Returns the leader logs channel, reusing the last resolved one while it is still the configured channel."""
+    global _leader_log_channel
+    if _leader_log_channel is not None and _leader_log_channel.id == channel_id:
+        return _leader_log_channel
+
+    # Client cache first, it doesn't need the guild
+    channel = bot.get_channel(channel_id)
+    if channel is None:
+        guild = await fetching.get_guild_cached(bot, HOME_GUILD_ID)
+        if guild is None:
+            print(f"[WARNING] [{PRINT_PREFIX}] Could not fetch home guild for leader logs.")
+            return None
+        channel = await fetching.get_channel_or_fetch(guild, channel_id)
+
+    if channel is None or not isinstance(channel, discord.TextChannel):
+        print(f"[WARNING] [{PRINT_PREFIX}] Could not fetch leader logs channel with ID {channel_id}.")
+        return None
+    _leader_log_channel = channel
+    return channel
 
 async def log_to_leader_logs(title: Literal["Demotion", "Promotion", "Role Added", "Role Removed", "Blacklist"], description: str, enforcer: discord.User | None = None) -> None:
     """
@@ -31,14 +62,8 @@ async def log_to_leader_logs(title: Literal["Demotion", "Promotion", "Role Added
         print(f"[WARNING] [{PRINT_PREFIX}] Leader logs channel not configured.")
         return
     
-    guild = await fetching.get_guild_or_fetch(bot, HOME_GUILD_ID)
-    if guild is None:
-        print(f"[WARNING] [{PRINT_PREFIX}] Could not fetch home guild for leader logs.")
-        return
-    
-    channel = await fetching.get_channel_or_fetch(guild, channel_id)
-    if channel is None or not isinstance(channel, discord.TextChannel):
-        print(f"[WARNING] [{PRINT_PREFIX}] Could not fetch leader logs channel with ID {channel_id}.")
+    channel = await _resolve_leader_log_channel(channel_id)
+    if channel is None:
         return
 
     embed = embeds.create_leader_log_embed(title, description, enforcer)
@@ -9,7 +9,7 @@ import discord
 # Local imports
 from config.env_vars import HOME_GUILD_ID
 from src.core.decorators import offload_fallback
-from src.core.fetching import get_guild_or_fetch, get_member_or_fetch
+from src.core.fetching import get_guild_cached, get_member_or_fetch
 
 @offload_fallback(PRINT_PREFIX)
 async def kick_user(bot, /, user_id: int, reason: str = "No reason provided", task_timeout: int = 10) -> bool:
@@ -28,7 +28,7 @@ async def kick_user(bot, /, user_id: int, reason: str = "No reason provided", ta
     Returns:
         bool: True if successful, False otherwise.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
         return False
@@ -63,18 +63,14 @@ async def ban_user(bot, /, user_id: int, reason: str = "No reason provided", tas
     Returns:
         bool: True if successful, False otherwise.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
         return False
 
     try:
-        member = guild.get_member(user_id)
-        if member:
-            await member.ban(reason=reason)
-        else:
-            await guild.ban(discord.Object(id=user_id), reason=reason)
-        
+        # Same endpoint whether or not the user is a member, no need to resolve the Member
+        await guild.ban(discord.Object(id=user_id), reason=reason)
         print(f"[INFO] [{PRINT_PREFIX}] Banned user {user_id} from guild {HOME_GUILD_ID}.")
         return True
 
@@ -99,20 +95,18 @@ async def unban_user(bot, /, user_id: int, reason: str = "No reason provided", t
         bool: True if successful, False otherwise.
     """
 
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
         return False
 
     try:
-        banned_users = await guild.bans()
-        user = discord.Object(id=user_id) # Create a user object with the given ID
-        for ban_entry in banned_users:
-            if ban_entry.user.id == user_id:
-                await guild.unban(user, reason=reason)
-                print(f"[INFO] [{PRINT_PREFIX}] Unbanned user {user_id} from guild {HOME_GUILD_ID}.")
-                return True
+        # Unban directly, Discord answers NotFound (Unknown Ban) when the user isn't banned
+        await guild.unban(discord.Object(id=user_id), reason=reason)
+        print(f"[INFO] [{PRINT_PREFIX}] Unbanned user {user_id} from guild {HOME_GUILD_ID}.")
+        return True
 
+    except discord.NotFound:
         print(f"[WARNING] [{PRINT_PREFIX}] User {user_id} is not banned in guild {HOME_GUILD_ID}.")
         return False
 
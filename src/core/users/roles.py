@@ -3,13 +3,16 @@
 
 PRINT_PREFIX = "CORE - USERS - ROLES"
 
+# Standard library imports
+import asyncio
+
 # Third-party imports
 import discord
 
 # Local imports
 from config.env_vars import HOME_GUILD_ID
 from src.core.decorators import offload_fallback
-from src.core.fetching import get_guild_or_fetch, get_member_or_fetch, get_role_or_fetch
+from src.core.fetching import get_guild_cached, get_member_or_fetch, get_role_or_fetch
 
 @offload_fallback(PRINT_PREFIX)
 async def add_role_to_user(bot, /, user_id: int, role_id: int, reason: str = "No reason provided", task_timeout: int = 10) -> bool:
@@ -29,21 +32,25 @@ async def add_role_to_user(bot, /, user_id: int, role_id: int, reason: str = "No
     Returns:
         bool: True if successful, False otherwise.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
         return False
 
-    member = await get_member_or_fetch(guild, user_id)
+    # Member and role lookups are independent, overlap them on a cache miss
+    member, role = await asyncio.gather(get_member_or_fetch(guild, user_id), get_role_or_fetch(guild, role_id))
     if member is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Member with ID {user_id} not found in guild {HOME_GUILD_ID}.")
         return False
 
-    role = await get_role_or_fetch(guild, role_id)
     if role is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Role with ID {role_id} not found in guild {HOME_GUILD_ID}.")
         return False
 
+    if member.get_role(role_id) is not None:
+        print(f"[DEBUG] [{PRINT_PREFIX}] User {user_id} already has role {role_id}, skipping.")
+        return True
+
     try:
         await member.add_roles(role, reason=reason)
         print(f"[INFO] [{PRINT_PREFIX}] Added role {role_id} to user {user_id} in guild {HOME_GUILD_ID}.")
@@ -70,21 +77,25 @@ async def remove_role_from_user(bot, /, user_id: int, role_id: int, reason: str
     Returns:
         bool: True if successful, False otherwise.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
         return False
 
-    member = await get_member_or_fetch(guild, user_id)
+    # Member and role lookups are independent, overlap them on a cache miss
+    member, role = await asyncio.gather(get_member_or_fetch(guild, user_id), get_role_or_fetch(guild, role_id))
     if member is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Member with ID {user_id} not found in guild {HOME_GUILD_ID}.")
         return False
 
-    role = await get_role_or_fetch(guild, role_id)
     if role is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Role with ID {role_id} not found in guild {HOME_GUILD_ID}.")
         return False
 
+    if member.get_role(role_id) is None:
+        print(f"[DEBUG] [{PRINT_PREFIX}] User {user_id} does not have role {role_id}, skipping.")
+        return True
+
     try:
         await member.remove_roles(role, reason=reason)
         print(f"[INFO] [{PRINT_PREFIX}] Removed role {role_id} from user {user_id} in guild {HOME_GUILD_ID}.")
@@ -94,14 +105,14 @@ async def remove_role_from_user(bot, /, user_id: int, role_id: int, reason: str
         return False
 
 @offload_fallback(PRINT_PREFIX)
-async def edit_user_roles(bot, /, user_id: int, new_roles: list[discord.Role], reason: str = "No reason provided", task_timeout: int = 15) -> bool:
+async def edit_user_roles(bot, /, user_id: int, new_roles: list[discord.abc.Snowflake], reason: str = "No reason provided", task_timeout: int = 15) -> bool:
     """
     Edits a user's roles to match the provided list of roles.
     
     Args:
         bot: The bot instance to use. (auto offloaded to worker or master bot, don't pass manually)
         user_id (int): The ID of the user to edit roles for.
-        new_roles (list[discord.Role]): List of roles to set for the user.
+        new_roles (list[discord.abc.Snowflake]): Roles to set for the user, discord.Object(id=...) avoids needing Role objects.
         reason (str): Reason for editing the roles.
         task_timeout (int): Timeout for the task execution:
             None: Will wait indefinitely.
@@ -112,7 +123,7 @@ async def edit_user_roles(bot, /, user_id: int, new_roles: list[discord.Role], r
         bool: True if successful, False otherwise.
     """
 
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
         return False
@@ -122,6 +133,11 @@ async def edit_user_roles(bot, /, user_id: int, new_roles: list[discord.Role], r
         print(f"[ERROR] [{PRINT_PREFIX}] Member with ID {user_id} not found in guild {HOME_GUILD_ID}.")
         return False
 
+    # @everyone is implicit, leave it out of the comparison
+    if {r.id for r in member.roles if r.id != guild.id} == {r.id for r in new_roles if r.id != guild.id}:
+        print(f"[DEBUG] [{PRINT_PREFIX}] Roles for user {user_id} already match, skipping.")
+        return True
+
     try:
         await member.edit(roles=new_roles, reason=reason)
         print(f"[INFO] [{PRINT_PREFIX}] Edited roles for user {user_id} in guild {HOME_GUILD_ID}.")
@@ -9,7 +9,10 @@ from datetime import timedelta
 # Local imports
 from config.env_vars import HOME_GUILD_ID
 from src.core.decorators import offload_fallback
-from src.core.fetching import get_guild_or_fetch, get_member_or_fetch
+from src.core.fetching import get_guild_cached, get_member_or_fetch
+
+# Durations used by moderation commands, built once instead of per call
+_TIMEDELTAS: dict[int, timedelta] = {s: timedelta(seconds=s) for s in (60, 300, 600, 1800, 3600, 21600, 86400, 604800)}
 
 @offload_fallback(PRINT_PREFIX)
 async def timeout_user(bot, /, user_id: int, duration: int, reason: str = "No reason provided", task_timeout: int = 10) -> bool:
@@ -28,7 +31,7 @@ async def timeout_user(bot, /, user_id: int, duration: int, reason: str = "No re
     Returns:
         bool: True if successful, False otherwise.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
         return False
@@ -39,8 +42,8 @@ async def timeout_user(bot, /, user_id: int, duration: int, reason: str = "No re
         return False
 
     try:
-        timeout_duration = timedelta(seconds=duration)
-        await member.edit(timeout_duration=timeout_duration, reason=reason)
+        timeout_duration = _TIMEDELTAS.get(duration) or timedelta(seconds=duration)
+        await member.timeout(timeout_duration, reason=reason)
         print(f"[INFO] [{PRINT_PREFIX}] Timed out user {user_id} in guild {HOME_GUILD_ID} for {duration} seconds.")
         return True
     except Exception as e:
@@ -64,7 +67,7 @@ async def remove_timeout_user(bot, /, user_id: int, reason: str = "No reason pro
     Returns:
         bool: True if successful, False otherwise.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
         return False
@@ -75,7 +78,7 @@ async def remove_timeout_user(bot, /, user_id: int, reason: str = "No reason pro
         return False
 
     try:
-        await member.edit(timeout_duration=None, reason=reason)
+        await member.timeout(None, reason=reason)
         print(f"[INFO] [{PRINT_PREFIX}] Removed timeout from user {user_id} in guild {HOME_GUILD_ID}.")
         return True
     except Exception as e:
@@ -6,7 +6,7 @@ PRINT_PREFIX = "CORE - USERS - VOICE"
 # Local imports
 from config.env_vars import HOME_GUILD_ID
 from src.core.decorators import offload_fallback
-from src.core.fetching import get_guild_or_fetch, get_member_or_fetch, get_channel_or_fetch
+from src.core.fetching import get_guild_cached, get_member_or_fetch, get_channel_or_fetch
 
 @offload_fallback(PRINT_PREFIX)
 async def disconnect_user(bot, /, user_id: int, reason: str = "No reason provided", task_timeout: int = 10) -> bool:
@@ -25,7 +25,7 @@ async def disconnect_user(bot, /, user_id: int, reason: str = "No reason provide
     Returns:
         bool: True if successful, False otherwise.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
         return False
@@ -65,7 +65,7 @@ async def move_user(bot, /, user_id: int, target_channel_id: int, reason: str =
     Returns:
         bool: True if successful, False otherwise.
     """
-    guild = await get_guild_or_fetch(bot, HOME_GUILD_ID)
+    guild = await get_guild_cached(bot, HOME_GUILD_ID)
     if guild is None:
         print(f"[ERROR] [{PRINT_PREFIX}] Guild with ID {HOME_GUILD_ID} not found.")
         return False
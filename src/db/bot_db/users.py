@@ -77,6 +77,50 @@ def get_user(user_id: int) -> dict | None:
     print(f"[INFO] [{PRINT_PREFIX}] No user found with user_id {user_id}")
     return None
 
+def get_user_with_leader(user_id: int) -> dict | None:
+    """
+    Retrieve a user entry together with its leader entry in a single query.
+
+    Returns:
+        dict: User data if found (same keys as get_user), None otherwise.
+        {
+            ...get_user fields,
+            "leader": dict | None (same keys as leaders.get_leader, None if the user is not a leader)
+        }
+    """
+    conn = _connect(read_only=True)
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT u.user_id, u.roblox_user_id, u.is_banned, u.is_leader_blacklisted, u.warnings, u.notes,
+               u.personal_blacklists, u.personal_whitelists,
+               l.user_id, l.leader_tier, l.promoted_at, l.last_win_at, l.last_host_at
+        FROM users u
+        LEFT JOIN leaders l ON l.user_id = u.user_id
+        WHERE u.user_id = ?;
+    """, (user_id,))
+    result = cursor.fetchone()
+    conn.close()
+    if result:
+        return {
+            "user_id": result[0],
+            "roblox_user_id": result[1],
+            "is_banned": bool(result[2]),
+            "is_leader_blacklisted": bool(result[3]),
+            "warnings": deserialize_json(result[4], default={}),
+            "notes": deserialize_json(result[5], default={}),
+            "personal_blacklists": deserialize_json(result[6], default=[]),
+            "personal_whitelists": deserialize_json(result[7], default=[]),
+            "leader": {
+                "user_id": result[8],
+                "leader_tier": result[9],
+                "promoted_at": result[10],
+                "last_win_at": result[11],
+                "last_host_at": result[12]
+            } if result[8] is not None else None
+        }
+    print(f"[INFO] [{PRINT_PREFIX}] No user found with user_id {user_id}")
+    return None
+
 def modify_user(user_id: int, roblox_user_id: int | None = None, 
                 is_banned: bool | None = None, is_leader_blacklisted: bool | None = None) -> bool:
     """Modify an existing user entry in the database."""
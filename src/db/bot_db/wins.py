@@ -73,6 +73,19 @@ def get_wins_by_user(user_id: int) -> list[dict]:
     print(f"[INFO] [{PRINT_PREFIX}] Retrieved wins for user_id {user_id}: {len(wins)} entries found")
     return wins
 
+def get_wins_count_by_user(user_id: int) -> int:
+    """Count the win entries for a specific user without loading the rows."""
+    conn = _connect(read_only=True)
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT COUNT(*)
+        FROM wins
+        WHERE user_id = ?;
+    """, (user_id,))
+    count = cursor.fetchone()[0]
+    conn.close()
+    return count
+
 def remove_win(win_message_id: int) -> bool:
     """Remove a win entry from the database."""
     conn = _connect()
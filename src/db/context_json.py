@@ -5,8 +5,13 @@
 PRINT_PREFIX = "CONTEXT JSON"
 
 # Standard library imports
+import atexit
 import json
 import os
+import tempfile
+import threading
+from concurrent.futures import Future
+from typing import Callable, Literal, TypeVar
 
 # Local imports
 from . import DB_DIR
@@ -31,38 +36,119 @@ with open(CONTEXT_JSON_PATH, 'r') as f:
     context_data = json.load(f)
 
 
-# Function to save context data back to context.json
-def _save_context_json() -> None:
-    """Save the context_data dictionary to context.json file."""
-    with open(CONTEXT_JSON_PATH, 'w') as f:
-        json.dump(context_data, f, indent=2)
+_SAVE_DELAY = 0.05 # Seconds to wait before saving, changes made in that window are written together
+_context_lock = threading.RLock() # Guards context_data mutations against a concurrent save
+_save_timer: threading.Timer | None = None
+_revision = 0 # Bumped on every change to context_data, lets readers tell whether their copy is current
+_save_future: Future = Future() # Resolves once the save covering the latest change is written (or fails)
+_save_future.set_result(None) # Nothing to save yet
+
+_change_listeners: list[Callable[[str], None]] = [] # Called with the changed section name after every change
+
+def add_change_listener(listener: Callable[[str], None]) -> None:
+    """Register a callback invoked with the section name (e.g. "dev") whenever context_data changes."""
+    _change_listeners.append(listener)
+
+# Functions to save context data back to context.json
+def _save_context_json(section: str) -> None:
+    """Notify listeners of a change to section and schedule a save of context_data.
+    Bursts of changes are coalesced into a single write, last_save() returns its future.
+    """
+    global _save_timer, _save_future, _revision
+    for listener in _change_listeners:
+        listener(section)
+    with _context_lock:
+        _revision += 1
+        if _save_timer is None:
+            _save_future = Future()
+            _save_timer = threading.Timer(_SAVE_DELAY, _flush_from_timer)
+            _save_timer.daemon = True
+            _save_timer.start()
+
+def last_save() -> Future:
+    """Returns the future of the save covering the latest change to context_data.
+    It resolves once context.json is written, or raises the write error. Await it with asyncio.wrap_future.
+    """
+    return _save_future
+
+def _flush_from_timer() -> None:
+    """Timer callback, errors are reported through the save future and logged."""
+    try:
+        flush_context_json()
+    except Exception as e:
+        print(f"[ERROR] [{PRINT_PREFIX}] Failed to save context.json: {e}")
+
+def flush_context_json() -> None:
+    """Write pending context_data changes to context.json now, if any are scheduled."""
+    global _save_timer
+    with _context_lock:
+        if _save_timer is None:
+            return
+        _save_timer.cancel()
+        _save_timer = None
+        future = _save_future
+        tmp_path = None
+        try:
+            # Write to a temporary file and swap it in, readers never see a half-written context.json
+            with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(CONTEXT_JSON_PATH), suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                json.dump(context_data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(f.name, CONTEXT_JSON_PATH)
+        except Exception as e:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path) # Don't leave a partial temp file behind
+            future.set_exception(e)
+            raise
+        future.set_result(None)
     print(f"[DEBUG] [{PRINT_PREFIX}] context.json saved")
 
+atexit.register(flush_context_json) # Don't lose changes still waiting for their save
+
+def get_revision() -> int:
+    """Returns the current revision of context_data, it changes whenever context_data does."""
+    return _revision
+
+_T = TypeVar("_T")
+
+def serialize_context_json(serialize: Callable[[dict], _T]) -> tuple[int, _T]:
+    """Runs serialize on context_data while holding the lock, so no change lands mid-serialization.
+    Returns (revision the result reflects, serialize result).
+    """
+    with _context_lock:
+        return _revision, serialize(context_data)
+
 def export_context_json() -> dict:
-    """Export the entire context_data dictionary"""
+    """Export the entire context_data dictionary, pending changes are saved first"""
+    flush_context_json()
     print(f"[DEBUG] [{PRINT_PREFIX}] Exported context.json data")
     return context_data
 
 # Functions to add or update entries in contextdata
 def add_category_entry(key: str, value: any) -> None:
     """Add or update a category entry in context_data."""
-    context_data["categories"][key] = value
-    _save_context_json()
+    with _context_lock:
+        context_data["categories"][key] = value
+        _save_context_json("categories")
 
 def add_channel_entry(key: str, value: any) -> None:
     """Add or update a channel entry in context_data."""
-    context_data["channels"][key] = value
-    _save_context_json()
+    with _context_lock:
+        context_data["channels"][key] = value
+        _save_context_json("channels")
 
 def add_role_entry(key: str, value: any) -> None:
     """Add or update a role entry in context_data."""
-    context_data["roles"][key] = value
-    _save_context_json()
+    with _context_lock:
+        context_data["roles"][key] = value
+        _save_context_json("roles")
 
 def add_dev_entry(key: str, value: any) -> None:
     """Add or update a developer-specific entry in context_data."""
-    context_data["dev"][key] = value
-    _save_context_json()
+    with _context_lock:
+        context_data["dev"][key] = value
+        _save_context_json("dev")
 
 
 # Functions to retrieve entries from contextdata
@@ -83,30 +169,67 @@ def get_dev_entry(key: str, default: any = None) -> any:
     return context_data["dev"].get(key, default)
 
 
+# Function to append to list entries in contextdata
+_SECTIONS = {"category": "categories", "channel": "channels", "role": "roles", "dev": "dev"} # Entry type -> context_data key
+_list_sets: dict[tuple[str, str], tuple[list, int, set]] = {} # (section, key) -> (list, its length, set mirror) for O(1) duplicate checks
+
+def _list_members(section: str, key: str, entry: list) -> set:
+    """Returns a set mirroring the list entry, rebuilt if the list was replaced or changed size elsewhere."""
+    cached = _list_sets.get((section, key))
+    if cached is None or cached[0] is not entry or cached[1] != len(entry):
+        cached = (entry, len(entry), set(entry))
+        _list_sets[(section, key)] = cached
+    return cached[2]
+
+def append_to_list_entry(entry_type: str, key: str, value: any) -> Literal["ok", "not_found", "not_list", "dup"]:
+    """Append a value to a list entry in context_data, saving once.
+    Nothing is modified unless "ok" is returned.
+    """
+    section = _SECTIONS[entry_type]
+    with _context_lock:
+        current_entry = context_data[section].get(key)
+        if current_entry is None:
+            return "not_found"
+        if not isinstance(current_entry, list):
+            return "not_list"
+        members = _list_members(section, key, current_entry)
+        if value in members:
+            return "dup"
+        current_entry.append(value)
+        members.add(value)
+        _list_sets[(section, key)] = (current_entry, len(current_entry), members)
+        _save_context_json(section)
+    return "ok"
+
+
 # Function to delete entries from contextdata
 def delete_category_entry(key: str) -> None:
     """Delete a category entry from context_data."""
-    if key in context_data["categories"]:
-        del context_data["categories"][key]
-        _save_context_json()
+    with _context_lock:
+        if key in context_data["categories"]:
+            del context_data["categories"][key]
+            _save_context_json("categories")
 
 def delete_channel_entry(key: str) -> None:
     """Delete a channel entry from context_data."""
-    if key in context_data["channels"]:
-        del context_data["channels"][key]
-        _save_context_json()
+    with _context_lock:
+        if key in context_data["channels"]:
+            del context_data["channels"][key]
+            _save_context_json("channels")
 
 def delete_role_entry(key: str) -> None:
     """Delete a role entry from context_data."""
-    if key in context_data["roles"]:
-        del context_data["roles"][key]
-        _save_context_json()
+    with _context_lock:
+        if key in context_data["roles"]:
+            del context_data["roles"][key]
+            _save_context_json("roles")
 
 def delete_dev_entry(key: str) -> None:
     """Delete a developer-specific entry from context_data."""
-    if key in context_data["dev"]:
-        del context_data["dev"][key]
-        _save_context_json()
+    with _context_lock:
+        if key in context_data["dev"]:
+            del context_data["dev"][key]
+            _save_context_json("dev")
 
 def get_developers() -> list:
     """Retrieve the list of developer user IDs."""
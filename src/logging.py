@@ -2,9 +2,11 @@
 # Overrides the built-in print function to log messages to a file with timestamps.
 # Also implements automatic log rotation at midnight, keeping logs for 7 days.
 
+import atexit
 import builtins
 import os
 import datetime
+import queue
 import threading
 from typing import Any
 from config.env_vars import DEBUG_ENABLED
@@ -32,28 +34,45 @@ log_lock = threading.Lock()
 
 startup_rotation = False # Will be set to True after application startup, which will trigger log rotation regardless of time
 
+write_queue: queue.SimpleQueue = queue.SimpleQueue() # Finished log lines waiting for the file write, drained by the writer thread
+
 def logging_print(*args: Any, **kwargs: Any) -> None:
-    """Custom print function for logging purposes."""
+    """Custom print function for logging purposes.
+    Filtering, formatting and the console print (including file=/end=/flush=) happen on the caller,
+    only the log file write is left to the writer thread.
+    """
     global DEBUG_ENABLED
+    texts = [str(arg) for arg in args] # Formatted now, later changes to mutable arguments don't leak into the log
     # Skip debug prints if DEBUG_ENABLED is False
-    for arg in args:
-        if not DEBUG_ENABLED and "[DEBUG]" in str(arg):
+    for text in texts:
+        if not DEBUG_ENABLED and "[DEBUG]" in text:
             return
         for skip_str in TO_SKIP:
-            if skip_str in str(arg):
+            if skip_str in text:
                 return
-    
-    original_print(*args, **kwargs)  # Print to console
 
-    text_output = ""
-    for arg in args:
-        text_output += str(arg) + " "
-    
-    bot_log = f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {text_output}\n"
-    with log_lock:
-        bot_logs.write(bot_log)
-        bot_logs.flush() # Force write to file
-    
+    original_print(*texts, **kwargs)  # Print to console (or the caller's file)
+    write_queue.put(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {' '.join(texts)} \n")
+
+def _log_writer():
+    """Writes queued log lines to the log file, in order. A None entry stops the writer."""
+    while True:
+        bot_log = write_queue.get()
+        if bot_log is None:
+            return
+
+        try:
+            with log_lock:
+                bot_logs.write(bot_log)
+                bot_logs.flush() # Force write to file
+        except Exception as e:
+            original_print(f"[ERROR] [{PRINT_PREFIX}] Failed to write log entry: {e}") # Keep the writer alive
+
+def _flush_on_exit():
+    """Stop the writer thread once everything queued so far has been written."""
+    write_queue.put(None)
+    log_writer_thread.join(timeout=5)
+
 def _rotate_log():
     """Rotate the log file by closing the current one and opening a new one."""
     global bot_logs
@@ -143,6 +162,11 @@ def auto_rotate_log():
             print("#"*70)
 
 
+# Start the log writer before overriding print, so no message is queued without a consumer
+log_writer_thread = threading.Thread(target=_log_writer, daemon=True)
+log_writer_thread.start()
+atexit.register(_flush_on_exit)
+
 # Override the built-in print function
 builtins.print = logging_print
 
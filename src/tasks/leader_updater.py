@@ -32,14 +32,19 @@ async def _remove_leader_roles(member: discord.Member) -> bool:
     """
     # Gather all leader-related role IDs
     all_tier_roles = cfg_exp.get_all_leader_role_ids()
-    roles_to_remove = [
+    roles_to_remove = {
         *all_tier_roles.values(),
         cfg_exp.get_on_break_role_id(),
         cfg_exp.get_general_leader_role_id(),
-    ]
+    }
+    
+    # Nothing to remove, skip the REST call
+    current_ids = {role.id for role in member.roles}
+    if current_ids.isdisjoint(roles_to_remove):
+        return True
     
     # Filter out all leader roles
-    new_roles = [role for role in member.roles if role.id not in roles_to_remove]
+    new_roles = [discord.Object(id=role_id) for role_id in current_ids - roles_to_remove]
     
     try:
         success = await user_roles.edit_user_roles(
@@ -71,7 +76,7 @@ def _due_for_demotion(leader: dict) -> bool:
         print(f"[ERROR] [{PRINT_PREFIX}] Invalid leader tier '{leader_tier}' for user_id {user_id}")
         return True  # Demote invalid tiers
     
-    wdt_days = cfg_exp.get_leader_tier_config(leader_tier).get("wdt_days")
+    wdt_days = cfg_exp.get_leader_tier_config_fast(leader_tier).get("wdt_days")
     if not wdt_days:
         return False  # No demotion days set, cannot be demoted
 
@@ -104,11 +109,11 @@ def _find_valid_leader_exluding_ranked(leader: dict) -> str | None:
     current_tier = leader.get("leader_tier")
     tier_index = cfg_exp.LEADER_TIERS.index(current_tier)
 
-    win_amount = len(wins_db.get_wins_by_user(leader.get("user_id")))
+    win_amount = wins_db.get_wins_count_by_user(leader.get("user_id"))
 
     for i in range(tier_index - 1, -1, -1):
         tier_name = cfg_exp.LEADER_TIERS[i]
-        tier_config = cfg_exp.get_leader_tier_config(tier_name)
+        tier_config = cfg_exp.get_leader_tier_config_fast(tier_name)
         wins_to_reach = tier_config.get("wins_to_reach")
 
         if wins_to_reach is None:
@@ -119,12 +124,9 @@ def _find_valid_leader_exluding_ranked(leader: dict) -> str | None:
         
     return None
 
-def _validate_leaderboard_tier(leader: dict, current_tier: str, top_10_leaders: list[dict]) -> str:
+def _validate_leaderboard_tier(leader: dict, current_tier: str, top_10_ids: frozenset[int]) -> str:
     """Check if a leader is to be promoted to ranked/admiral based on leaderboard status OR demoted from ranked/admiral."""
-    for user_id, _ in top_10_leaders:
-        if not user_id == leader.get("user_id"):
-            continue
-
+    if leader.get("user_id") in top_10_ids:
         if current_tier == "admiral":
             return "N/A" # Stays the same
         elif current_tier == "ranked":
@@ -145,10 +147,10 @@ def _validate_leaderboard_tier(leader: dict, current_tier: str, top_10_leaders:
     print(f"[INFO] [{PRINT_PREFIX}] Leader with user_id {leader.get('user_id')} remains in tier '{current_tier}'.")
     return "N/A"  # Stays the same
     
-async def _check_for_leaderboard_promotion_or_demotion(leader: dict, member: discord.Member, top_10_leaders: list[dict]) -> bool:
+async def _check_for_leaderboard_promotion_or_demotion(leader: dict, member: discord.Member, top_10_ids: frozenset[int]) -> bool:
     """Check and promote/demote a leader based on leaderboard status."""
     current_tier = leader.get("leader_tier")
-    new_tier = _validate_leaderboard_tier(leader, current_tier, top_10_leaders)
+    new_tier = _validate_leaderboard_tier(leader, current_tier, top_10_ids)
 
     if new_tier == "N/A" or new_tier == current_tier:
         return False  # No change
@@ -206,10 +208,12 @@ async def leader_updater():
         return
 
     leaders = leaders_db.get_all_leaders()
-    top_10_leaders = wins_db.get_sorted_top_winners(10)
+    top_10_ids = frozenset(user_id for user_id, _ in wins_db.get_sorted_top_winners(10)) # Built once per run, checked per leader
+
+    members = await fetching.get_members_or_fetch(guild, [leader["user_id"] for leader in leaders])
 
     for leader in leaders:
-        member = await fetching.get_member_or_fetch(guild, leader["user_id"])
+        member = members.get(leader["user_id"])
 
         # Remove leader if not found in guild
         if not member:
@@ -223,7 +227,7 @@ async def leader_updater():
             continue  # Skip further checks if demoted
 
         # Check for promotion/demotion based on leaderboard
-        await _check_for_leaderboard_promotion_or_demotion(leader, member, top_10_leaders)
+        await _check_for_leaderboard_promotion_or_demotion(leader, member, top_10_ids)
 
     # Ensure no users have leader roles without being in the leaders database
     all_tier_role_ids = list(cfg_exp.get_all_leader_role_ids().values())
@@ -1,5 +1,5 @@
 # src\workers\__init__.py
 
-from .queue import WorkerQueue
+from .queue import WorkerQueue, WorkerDispatchError
     
 WORKER_QUEUE = WorkerQueue() # Global worker queue instance
\ No newline at end of file
@@ -8,7 +8,7 @@ from typing import Any
 
 # Local imports
 from config.env_vars import HOME_GUILD_ID
-from src.core.fetching import get_guild_or_fetch
+from src.core.fetching import get_guild_or_fetch, register_miss_cache_listeners
 
 
 def start(worker: Any) -> None:
@@ -20,6 +20,7 @@ def start(worker: Any) -> None:
     from . import tasks as worker_tasks
     
     bot = worker.bot_instance
+    register_miss_cache_listeners(bot) # Misses recorded by this bot are invalidated by its own events
     
     async def on_ready():
         print(f"[INFO] [{PRINT_PREFIX}] Worker {worker.index} logged in as {bot.user}.")
@@ -3,9 +3,16 @@
 
 PRINT_PREFIX = "WORKER QUEUE"
 
+# Standard library imports
+import heapq
+
+class WorkerDispatchError(Exception):
+    """Raised when a task could not be scheduled on a worker, the task never started so it is safe to retry elsewhere."""
+
 class WorkerQueue:
     _workers = [] # List to hold worker instances, will be populated later
     _worker_index = 0
+    _idle = [] # Heap of (tasks performed, worker index) for workers with no task in flight
 
     def _get_nearest_running_worker(self) -> object | None:
         """Returns the nearest running worker in the queue."""
@@ -32,10 +39,30 @@ class WorkerQueue:
         print(f"[DEBUG] [{PRINT_PREFIX}] Assigned Worker {worker.index} to task.")
         return worker
     
+    def get_available_worker(self) -> object | None:
+        """Returns an idle running worker (least used first), or the least loaded running worker if none are idle."""
+        while self._idle:
+            _, index = heapq.heappop(self._idle)
+            worker = self._workers[index]
+            if worker.running:
+                print(f"[DEBUG] [{PRINT_PREFIX}] Assigned idle Worker {worker.index} to task.")
+                return worker
+
+        running = [worker for worker in self._workers if worker.running]
+        if not running:
+            return None
+        return min(running, key=lambda worker: worker.active)
+
+    def release_worker(self, worker: object) -> None:
+        """Puts a worker back on the idle heap, call once it has no task in flight."""
+        heapq.heappush(self._idle, (worker.tasks_performed, worker.index))
+    
     def add_worker(self, worker: object) -> int:
         """Adds a worker to the worker queue.
         Returns the index of the added worker.
         """
         self._workers.append(worker)
-        print(f"[DEBUG] [{PRINT_PREFIX}] Added Worker {len(self._workers) - 1} to the queue.")
-        return len(self._workers) - 1
+        index = len(self._workers) - 1
+        heapq.heappush(self._idle, (0, index))
+        print(f"[DEBUG] [{PRINT_PREFIX}] Added Worker {index} to the queue.")
+        return index
@@ -2,6 +2,7 @@
 # Worker object
 
 PRINT_PREFIX = "WORKER"
+_DEBUG = f"[DEBUG] [{PRINT_PREFIX}] "
 
 # Standard library imports
 import threading
@@ -13,7 +14,9 @@ import time
 import discord
 from discord.ext import commands
 
-from . import WORKER_QUEUE
+# Local imports
+from config.env_vars import DEBUG_ENABLED
+from . import WORKER_QUEUE, WorkerDispatchError
 from . import events as worker_events
 
 class Worker:
@@ -26,6 +29,7 @@ class Worker:
         self.running = False
 
         self.tasks_performed = 0
+        self.active = 0 # Tasks dispatched through the async path that have not finished yet
 
     def __str__(self):
         return f"Worker#{self.index}: token={self.ptoken}, running={self.running}"
@@ -78,13 +82,15 @@ class Worker:
             return False
         new_args = (self.bot_instance, ) + args # Prepend bot_instance to args
         result = asyncio.run_coroutine_threadsafe(task_function(*new_args, **kwargs), self.bot_instance.loop)
-        print(f"[DEBUG] [{PRINT_PREFIX}] Worker {self.index} executing task {task_function.__name__}.")
+        if DEBUG_ENABLED:
+            print(_DEBUG + f"Worker {self.index} executing task {task_function.__name__}.")
         try:
             if task_timeout == 0:
                 self.tasks_performed += 1
                 return True
             result.result(timeout=task_timeout)
-            print(f"[DEBUG] [{PRINT_PREFIX}] Worker {self.index} completed task {task_function.__name__}.")
+            if DEBUG_ENABLED:
+                print(_DEBUG + f"Worker {self.index} completed task {task_function.__name__}.")
             self.tasks_performed += 1
             return True
         except concurrent.futures.TimeoutError:
@@ -116,13 +122,15 @@ class Worker:
             return None
         new_args = (self.bot_instance, ) + args # Prepend bot_instance to args
         result = asyncio.run_coroutine_threadsafe(task_function(*new_args, **kwargs), self.bot_instance.loop)
-        print(f"[DEBUG] [{PRINT_PREFIX}] Worker {self.index} executing task {task_function.__name__}.")
+        if DEBUG_ENABLED:
+            print(_DEBUG + f"Worker {self.index} executing task {task_function.__name__}.")
         try:
             if task_timeout == 0:
                 self.tasks_performed += 1
                 return None
             res = result.result(timeout=task_timeout)
-            print(f"[DEBUG] [{PRINT_PREFIX}] Worker {self.index} completed task {task_function.__name__}.")
+            if DEBUG_ENABLED:
+                print(_DEBUG + f"Worker {self.index} completed task {task_function.__name__}.")
             self.tasks_performed += 1
             return res
         except concurrent.futures.TimeoutError:
@@ -132,6 +140,79 @@ class Worker:
             print(f"[ERROR] [{PRINT_PREFIX}] Worker {self.index} task {task_function.__name__} raised an exception: {e}")
             return None
 
+    async def _execute_async(self, task_function: callable, task_timeout: int | None, args: tuple, kwargs: dict) -> tuple[bool, any]:
+        """
+        Schedules a task on this worker's event loop and awaits it from the calling loop,
+        without blocking an executor thread on the result.
+
+        Returns:
+            tuple[bool, any]: (True, result) if completed or fire-and-forget, (False, None) on timeout or exception.
+        Raises:
+            WorkerDispatchError: If the task could not be scheduled (the task did not run).
+        """
+        if not self.running:
+            raise WorkerDispatchError(f"Worker {self.index} is not running.")
+        coro = task_function(self.bot_instance, *args, **kwargs)
+        try:
+            future = asyncio.run_coroutine_threadsafe(coro, self.bot_instance.loop)
+        except Exception as e:
+            coro.close() # Never scheduled, close it to avoid the "never awaited" warning
+            self.running = False # Loop is gone (closed/shut down), stop handing this worker out
+            raise WorkerDispatchError(f"Worker {self.index} could not schedule task {task_function.__name__}: {e}") from e
+        if DEBUG_ENABLED:
+            print(_DEBUG + f"Worker {self.index} executing task {task_function.__name__}.")
+        # Wrapped on the calling loop, so the done callback runs there too and can touch WORKER_QUEUE safely
+        wrapped = asyncio.wrap_future(future)
+        self.active += 1
+        wrapped.add_done_callback(self._task_done)
+        if task_timeout == 0:
+            self.tasks_performed += 1
+            return True, None
+        try:
+            res = await asyncio.wait_for(wrapped, task_timeout)
+            if DEBUG_ENABLED:
+                print(_DEBUG + f"Worker {self.index} completed task {task_function.__name__}.")
+            self.tasks_performed += 1
+            return True, res
+        except asyncio.TimeoutError:
+            print(f"[ERROR] [{PRINT_PREFIX}] Worker {self.index} task {task_function.__name__} timed out.")
+            return False, None
+        except Exception as e:
+            print(f"[ERROR] [{PRINT_PREFIX}] Worker {self.index} task {task_function.__name__} raised an exception: {e}")
+            return False, None
+
+    def _task_done(self, _future: asyncio.Future) -> None:
+        """Done callback for async tasks, returns the worker to the idle heap once nothing is in flight."""
+        self.active -= 1
+        if self.active == 0:
+            WORKER_QUEUE.release_worker(self)
+
+    async def execute_task_async(self, task_function: callable, task_timeout: int | None = 5, *args, **kwargs) -> bool:
+        """
+        Awaitable version of execute_task, for callers running on another event loop.
+        A timed out task is cancelled on the worker loop.
+
+        Returns:
+            bool: True if the task completed successfully or if task_timeout was set to 0, False if it timed out or raised an exception.
+        Raises:
+            WorkerDispatchError: If the task could not be scheduled (the task did not run).
+        """
+        success, _ = await self._execute_async(task_function, task_timeout, args, kwargs)
+        return success
+
+    async def execute_task_return_async(self, task_function: callable, task_timeout: int | None = 5, *args, **kwargs) -> any:
+        """
+        Awaitable version of execute_task_return, for callers running on another event loop.
+        A timed out task is cancelled on the worker loop.
+
+        Returns:
+            any: The result of the task function if completed successfully, None if it timed out or raised an exception.
+        Raises:
+            WorkerDispatchError: If the task could not be scheduled (the task did not run).
+        """
+        _, res = await self._execute_async(task_function, task_timeout, args, kwargs)
+        return res
+
 def start_workers(worker_tokens: list[str]) -> None:
     """Starts all workers in the global WORKER_QUEUE."""
     for token in worker_tokens: